@@ -2,12 +2,10 @@
 # Module describing the additional stim-specialized operations.
 # -------------------------------------------
 from dataclasses import dataclass, field
-from typing import Any, Optional, Dict, List
+from typing import Any, Optional, Dict
 import stim
 from qce_circuit.structure.intrf_circuit_operation import (
     ICircuitOperation,
-    ChannelIdentifier,
-    QubitChannel,
 )
 from qce_circuit.structure.circuit_operations import (
     Barrier,
@@ -19,7 +17,7 @@ from qce_circuit.structure.registry_duration import (
 )
 
 
-@dataclass(frozen=False)
+@dataclass(frozen=False, eq=False)
 class CoordinateShiftOperation(Barrier, ICircuitOperation):
     """
     Basic channel operation covers all qubit channels.
@@ -52,14 +50,10 @@ class CoordinateShiftOperation(Barrier, ICircuitOperation):
                 float(self.time_shift)
             ],
         )
-
-    def __hash__(self):
-        """Overwrites @dataclass behaviour. Circuit operation requires hash based on instance identity."""
-        return id(self)
     # endregion
 
 
-@dataclass(frozen=False, unsafe_hash=True)
+@dataclass(frozen=False, eq=False)
 class DetectorOperation(SingleQubitOperation, ICircuitOperation):
     """
     Basic channel operation covers all qubit channels.
@@ -71,15 +65,6 @@ class DetectorOperation(SingleQubitOperation, ICircuitOperation):
     reference_offset: Optional[int] = field(init=True, default=None)
     secondary_offset: Optional[int] = field(init=True, default=None)
 
-    # region Interface Properties
-    @property
-    def channel_identifiers(self) -> List[ChannelIdentifier]:
-        """:return: Array-like of channel identifiers to which this operation applies to."""
-        return [
-            ChannelIdentifier(_id=self.qubit_index, _channel=QubitChannel.ALL),
-        ]
-    # endregion
-
     # region Interface Methods
     def copy(self, relation_transfer_lookup: Optional[Dict[ICircuitOperation, ICircuitOperation]] = None) -> 'DetectorOperation':
         """
@@ -153,7 +138,7 @@ class DetectorOperation(SingleQubitOperation, ICircuitOperation):
     # endregion
 
 
-@dataclass(frozen=False, unsafe_hash=True)
+@dataclass(frozen=False, eq=False)
 class LogicalObservableOperation(SingleQubitOperation, ICircuitOperation):
     """
     Basic channel operation covers all qubit channels.
@@ -162,15 +147,6 @@ class LogicalObservableOperation(SingleQubitOperation, ICircuitOperation):
     last_acquisition_index: Optional[int] = field(init=True, default=None)
     main_target: Optional[int] = field(init=True, default=None)
 
-    # region Interface Properties
-    @property
-    def channel_identifiers(self) -> List[ChannelIdentifier]:
-        """:return: Array-like of channel identifiers to which this operation applies to."""
-        return [
-            ChannelIdentifier(_id=self.qubit_index, _channel=QubitChannel.ALL),
-        ]
-    # endregion
-
     # region Interface Methods
     def copy(self, relation_transfer_lookup: Optional[Dict[ICircuitOperation, ICircuitOperation]] = None) -> 'LogicalObservableOperation':
         """
@@ -2,7 +2,7 @@
 # Module describing the implementation of declarative circuit language.
 # -------------------------------------------
 from multipledispatch import dispatch
-from typing import List, Dict
+from typing import List, Dict, Iterable
 import numpy as np
 from numpy.typing import NDArray
 from qce_circuit.utilities.custom_exceptions import NoReferenceOperationException
@@ -182,3 +182,17 @@ class DeclarativeCircuit(IDeclarativeCircuit):
         """:return: Acquisition Strategy based on internal registry."""
         return RegistryAcquisitionStrategy(registry=self.acquisition_registry)
     # endregion
+
+    # region Class Methods
+    def add_operations(self, operations: Iterable[ICircuitOperation]) -> 'DeclarativeCircuit':
+        """
+        Bulk equivalent of add_operation, skips per-operation type dispatch.
+        Operations are added in order, expects (decomposed) non-composite operations.
+        :return: Self. Adds operations to circuit.
+        """
+        operations = list(operations)
+        for operation in operations:
+            self._structure.add(operation)
+        self._added_operations.extend(operations)
+        return self
+    # endregion
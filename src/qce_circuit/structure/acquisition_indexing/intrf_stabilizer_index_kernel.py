@@ -16,6 +16,14 @@ class StateKey(Enum):
     STATE_1 = 1
     STATE_2 = 2
 
+    # region Class Methods
+    def __int__(self) -> int:
+        """:return: Integer state value. Allows C-level sorting through `sorted(states, key=int)`."""
+        return self.value
+
+    __index__ = __int__
+    # endregion
+
 
 class IStabilizerIndexingKernel(IIndexingKernel, metaclass=ABCMeta):
     """
@@ -4,7 +4,9 @@
 # -------------------------------------------
 from abc import abstractmethod, ABCMeta
 from dataclasses import dataclass, field
-from typing import List
+from typing import List, Tuple
+import numpy as np
+from numpy.typing import NDArray
 from qce_circuit.utilities.custom_exceptions import InterfaceMethodException
 from qce_circuit.structure.acquisition_indexing.intrf_index_kernel import IIndexingKernel
 from qce_circuit.structure.acquisition_indexing.intrf_index_strategy import IIndexStrategy
@@ -12,14 +14,20 @@ from qce_circuit.structure.acquisition_indexing.intrf_stabilizer_index_kernel im
 from qce_circuit.connectivity.intrf_channel_identifier import IQubitID
 
 
+_EMPTY_INDICES: NDArray[np.int_] = np.empty(0, dtype=np.intp)
+"""Shared (read-only) empty index array, returned whenever an element or state is not part of a kernel."""
+_EMPTY_INDICES.setflags(write=False)
+
+
 @dataclass(frozen=True)
 class QutritCalibrationIndexKernel(IIndexingKernel):
     """Data class, containing information about qutrit calibration-points (measurement acquisition) indexing."""
     heralded_initialization: bool
     """Boolean whether heralded initialization is performed at the start of the kernel."""
-    index_offset_strategy: IIndexStrategy = field(repr=False)
+    index_offset_strategy: IIndexStrategy = field(repr=False, hash=False)
     """Determines reference index by which internal indices are offset."""
-    involved_qubit_ids: List[IQubitID] = field(repr=False)
+    involved_qubit_ids: List[IQubitID] = field(repr=False, hash=False)
+    """Array-like of involved qubit-ID's. Excluded from hash (unhashable list), still part of equality."""
 
     # region Interface Properties
     @property
@@ -62,76 +70,86 @@ class QutritCalibrationIndexKernel(IIndexingKernel):
     # region Interface Methods
     def contains(self, element: IQubitID) -> List[int]:
         """:return: Array-like of measurement indices corresponding to element within this indexing kernel."""
-        heralded_0_measurement_indices: List[int] = self.get_heralded_state_0_measurement_index(element)
-        heralded_1_measurement_indices: List[int] = self.get_heralded_state_1_measurement_index(element)
-        heralded_2_measurement_indices: List[int] = self.get_heralded_state_2_measurement_index(element)
-        state_0_measurement_indices: List[int] = self.get_state_0_measurement_index(element)
-        state_1_measurement_indices: List[int] = self.get_state_1_measurement_index(element)
-        state_2_measurement_indices: List[int] = self.get_state_2_measurement_index(element)
-        return sorted(heralded_0_measurement_indices + heralded_1_measurement_indices + heralded_2_measurement_indices + state_0_measurement_indices + state_1_measurement_indices + state_2_measurement_indices)
-
-    def get_heralded_state_0_measurement_index(self, element: IQubitID) -> List[int]:
+        if element not in self.involved_qubit_ids:
+            return []
+        if not self.heralded_initialization:
+            return (self._exclusive_start_index + self._offset_table[1::2]).tolist()
+        return (self._exclusive_start_index + self._offset_table).tolist()
+
+    def get_heralded_state_0_measurement_index(self, element: IQubitID) -> NDArray[np.int_]:
         """
         If element not part of this kernel, return None.
         If no heralded initialization is performed, return None.
         :return: (Optional) index corresponding to heralded measurement.
         """
         if element not in self.involved_qubit_ids:
-            return []
+            return _EMPTY_INDICES
         if not self.heralded_initialization:
-            return []
-        return [self._exclusive_start_index + self.index_delta_heralded_initialization]
+            return _EMPTY_INDICES
+        return self._exclusive_start_index + self._offset_table[0:1]
 
-    def get_heralded_state_1_measurement_index(self, element: IQubitID) -> List[int]:
+    def get_heralded_state_1_measurement_index(self, element: IQubitID) -> NDArray[np.int_]:
         """
         If element not part of this kernel, return None.
         If no heralded initialization is performed, return None.
         :return: (Optional) index corresponding to heralded measurement.
         """
         if element not in self.involved_qubit_ids:
-            return []
+            return _EMPTY_INDICES
         if not self.heralded_initialization:
-            return []
-        return [self._exclusive_start_index + 2 * self.index_delta_heralded_initialization + self.index_delta_state_0]
+            return _EMPTY_INDICES
+        return self._exclusive_start_index + self._offset_table[2:3]
 
-    def get_heralded_state_2_measurement_index(self, element: IQubitID) -> List[int]:
+    def get_heralded_state_2_measurement_index(self, element: IQubitID) -> NDArray[np.int_]:
         """
         If element not part of this kernel, return None.
         If no heralded initialization is performed, return None.
         :return: (Optional) index corresponding to heralded measurement.
         """
         if element not in self.involved_qubit_ids:
-            return []
+            return _EMPTY_INDICES
         if not self.heralded_initialization:
-            return []
-        return [self._exclusive_start_index + 3 * self.index_delta_heralded_initialization + self.index_delta_state_0 + self.index_delta_state_1]
+            return _EMPTY_INDICES
+        return self._exclusive_start_index + self._offset_table[4:5]
 
-    def get_state_0_measurement_index(self, element: IQubitID) -> List[int]:
+    def get_state_0_measurement_index(self, element: IQubitID) -> NDArray[np.int_]:
         """
         If element not part of this kernel, return None.
         :return: (Optional) index corresponding to State-0 measurement.
         """
         if element not in self.involved_qubit_ids:
-            return []
-        return [self._exclusive_start_index + self.index_delta_heralded_initialization + self.index_delta_state_0]
+            return _EMPTY_INDICES
+        return self._exclusive_start_index + self._offset_table[1:2]
 
-    def get_state_1_measurement_index(self, element: IQubitID) -> List[int]:
+    def get_state_1_measurement_index(self, element: IQubitID) -> NDArray[np.int_]:
         """
         If element not part of this kernel, return None.
         :return: (Optional) index corresponding to State-1 measurement.
         """
         if element not in self.involved_qubit_ids:
-            return []
-        return [self._exclusive_start_index + 2 * self.index_delta_heralded_initialization + self.index_delta_state_0 + self.index_delta_state_1]
+            return _EMPTY_INDICES
+        return self._exclusive_start_index + self._offset_table[3:4]
 
-    def get_state_2_measurement_index(self, element: IQubitID) -> List[int]:
+    def get_state_2_measurement_index(self, element: IQubitID) -> NDArray[np.int_]:
         """
         If element not part of this kernel, return None.
         :return: (Optional) index corresponding to State-2 measurement.
         """
         if element not in self.involved_qubit_ids:
-            return []
-        return [self._exclusive_start_index + 3 * self.index_delta_heralded_initialization + self.index_delta_state_0 + self.index_delta_state_1 + self.index_delta_state_2]
+            return _EMPTY_INDICES
+        return self._exclusive_start_index + self._offset_table[5:6]
+    # endregion
+
+    # region Class Methods
+    def __post_init__(self):
+        # Ordered (inclusive) index offsets: [heralded-0, state-0, heralded-1, state-1, heralded-2, state-2].
+        h: int = self.index_delta_heralded_initialization
+        d0: int = self.index_delta_state_0
+        d1: int = self.index_delta_state_1
+        d2: int = self.index_delta_state_2
+        offset_table: NDArray[np.int_] = np.array([h, h + d0, 2 * h + d0, 2 * h + d0 + d1, 3 * h + d0 + d1, 3 * h + d0 + d1 + d2], dtype=np.intp)
+        offset_table.setflags(write=False)
+        object.__setattr__(self, '_offset_table', offset_table)
     # endregion
 
 
@@ -149,25 +167,25 @@ class IGeneralCalibrationIndexKernel(IIndexingKernel, metaclass=ABCMeta):
 
     @property
     @abstractmethod
-    def contained_states(self) -> List[StateKey]:
+    def contained_states(self) -> Tuple[StateKey, ...]:
         """:return: Array-like of contained state keys."""
         raise InterfaceMethodException
     # endregion
 
     # region Interface Methods
     @abstractmethod
-    def get_heralded_state_measurement_index(self, state: StateKey) -> List[int]:
+    def get_heralded_state_measurement_index(self, state: StateKey) -> NDArray[np.int_]:
         """
-        If no heralded initialization is performed, return empty list.
-        If state is not included, return empty list.
+        If no heralded initialization is performed, return empty array.
+        If state is not included, return empty array.
         :return: (Optional) index corresponding to heralded measurement.
         """
         raise InterfaceMethodException
 
     @abstractmethod
-    def get_calibration_state_measurement_index(self, state: StateKey) -> List[int]:
+    def get_calibration_state_measurement_index(self, state: StateKey) -> NDArray[np.int_]:
         """
-        If state is not included, return empty list.
+        If state is not included, return empty array.
         :return: (Optional) index corresponding to calibration measurement.
         """
         raise InterfaceMethodException
@@ -179,8 +197,8 @@ class GeneralCalibrationIndexKernel(IGeneralCalibrationIndexKernel):
     """
     Data class, containing information about qubit/qutrit calibration-points (measurement acquisition) indexing.
     """
-    index_offset_strategy: IIndexStrategy = field(repr=False)
-    """Determines reference index by which internal indices are offset."""
+    index_offset_strategy: IIndexStrategy = field(repr=False, hash=False)
+    """Determines reference index by which internal indices are offset. Excluded from hash (may reference other kernels)."""
     heralded_initialization: bool = field(default=False)
     """Boolean whether heralded initialization is performed at the start of the kernel."""
     f_state: bool = field(default=False)
@@ -210,68 +228,78 @@ class GeneralCalibrationIndexKernel(IGeneralCalibrationIndexKernel):
         return self.heralded_initialization
 
     @property
-    def contained_states(self) -> List[StateKey]:
+    def contained_states(self) -> Tuple[StateKey, ...]:
         """:return: Array-like of contained state keys."""
-        if self.f_state:
-            return [
-                StateKey.STATE_0,
-                StateKey.STATE_1,
-                StateKey.STATE_2,
-            ]
-        return [
-            StateKey.STATE_0,
-            StateKey.STATE_1
-        ]
+        return self._contained_states
     # endregion
 
     # region Class Properties
     @property
     def cycle_length(self) -> int:
         """:return: Length of single cycle."""
-        return 2**self.heralded_initialization * (2 + self.f_state)
+        return self._cycle_length
     # endregion
 
     # region Interface Methods
     def contains(self, element: IQubitID) -> List[int]:
-        """:return: Array-like of measurement indices corresponding to element within this indexing kernel."""
+        """
+        Note: All measurements within this kernel are shared by every element, indices do not depend on element.
+        :return: Array-like of measurement indices corresponding to element within this indexing kernel.
+        """
         return list(range(self.start_index, self.stop_index + 1))
 
-    def get_heralded_state_measurement_index(self, state: StateKey) -> List[int]:
+    def get_heralded_state_measurement_index(self, state: StateKey) -> NDArray[np.int_]:
         """
-        If no heralded initialization is performed, return empty list.
-        If state is not included, return empty list.
+        If no heralded initialization is performed, return empty array.
+        If state is not included, return empty array.
         :return: (Optional) index corresponding to heralded measurement.
         """
         if not self.heralded_initialization:
-            return []
+            return _EMPTY_INDICES
         if state not in self.contained_states:
-            return []
+            return _EMPTY_INDICES
 
-        all_indices: List[int] = list(range(self.start_index, self.stop_index + 1))
-        cycle_length: int = self.cycle_length
         if state == StateKey.STATE_0:
-            return all_indices[0::cycle_length]
+            return self._get_strided_indices(cycle_offset=0)
         if state == StateKey.STATE_1:
-            return all_indices[2::cycle_length]
+            return self._get_strided_indices(cycle_offset=2)
         if state == StateKey.STATE_2:
-            return all_indices[4::cycle_length]
-        return []
+            return self._get_strided_indices(cycle_offset=4)
+        return _EMPTY_INDICES
 
-    def get_calibration_state_measurement_index(self, state: StateKey) -> List[int]:
+    def get_calibration_state_measurement_index(self, state: StateKey) -> NDArray[np.int_]:
         """
-        If state is not included, return empty list.
+        If state is not included, return empty array.
         :return: (Optional) index corresponding to calibration measurement.
         """
         if state not in self.contained_states:
-            return []
+            return _EMPTY_INDICES
 
-        all_indices: List[int] = list(range(self.start_index, self.stop_index + 1))
-        cycle_length: int = self.cycle_length
         if state == StateKey.STATE_0:
-            return all_indices[1::cycle_length]
+            return self._get_strided_indices(cycle_offset=1)
         if state == StateKey.STATE_1:
-            return all_indices[3::cycle_length]
+            return self._get_strided_indices(cycle_offset=3)
         if state == StateKey.STATE_2:
-            return all_indices[5::cycle_length]
-        return []
+            return self._get_strided_indices(cycle_offset=5)
+        return _EMPTY_INDICES
+    # endregion
+
+    # region Class Methods
+    def _get_strided_indices(self, cycle_offset: int) -> NDArray[np.int_]:
+        """
+        Resolves start index only once, stop index follows from cycle length and repetitions.
+        :param cycle_offset: Index offset within a single cycle.
+        :return: Array of indices at cycle offset, one for each kernel repetition.
+        """
+        start_index: int = self.start_index
+        stop_index: int = start_index - 1 + self.cycle_length * self.repetitions
+        return np.arange(start_index + cycle_offset, stop_index + 1, self.cycle_length, dtype=np.intp)
+
+    def __post_init__(self):
+        # Kernel layout is fixed at construction, cache derived values once.
+        object.__setattr__(self, '_cycle_length', (2 if self.heralded_initialization else 1) * (2 + self.f_state))
+        if self.f_state:
+            object.__setattr__(self, '_contained_states', (StateKey.STATE_0, StateKey.STATE_1, StateKey.STATE_2))
+        else:
+            object.__setattr__(self, '_contained_states', (StateKey.STATE_0, StateKey.STATE_1))
     # endregion
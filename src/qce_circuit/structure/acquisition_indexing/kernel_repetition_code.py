@@ -3,7 +3,7 @@
 # Specializes repetition-code kernel implementations.
 # -------------------------------------------
 from dataclasses import dataclass, field
-from typing import List
+from typing import List, Union
 import warnings
 import numpy as np
 from numpy.typing import NDArray
@@ -210,11 +210,11 @@ class RepetitionExperimentKernel(IStabilizerIndexingKernel):
         :return: Tensor of indices pointing at all projection acquisition within calibration points.
         """
         if state == StateKey.STATE_0:
-            single_cycle_indices: List[int] = self._calibration_kernel.get_state_0_measurement_index(element=qubit_id)
+            single_cycle_indices: NDArray[np.int_] = self._calibration_kernel.get_state_0_measurement_index(element=qubit_id)
         elif state == StateKey.STATE_1:
-            single_cycle_indices: List[int] = self._calibration_kernel.get_state_1_measurement_index(element=qubit_id)
+            single_cycle_indices: NDArray[np.int_] = self._calibration_kernel.get_state_1_measurement_index(element=qubit_id)
         elif state == StateKey.STATE_2:
-            single_cycle_indices: List[int] = self._calibration_kernel.get_state_2_measurement_index(element=qubit_id)
+            single_cycle_indices: NDArray[np.int_] = self._calibration_kernel.get_state_2_measurement_index(element=qubit_id)
         else:
             raise NotImplementedError(f"Calibration indices for state: {state}, is not implemented.")
         return self.create_sliced_array(single_cycle_indices, self.kernel_cycle_length, self.experiment_repetitions)
@@ -226,11 +226,11 @@ class RepetitionExperimentKernel(IStabilizerIndexingKernel):
         :return: Tensor of indices pointing at all heralded acquisition before calibration points.
         """
         if state == StateKey.STATE_0:
-            single_cycle_indices: List[int] = self._calibration_kernel.get_heralded_state_0_measurement_index(element=qubit_id)
+            single_cycle_indices: NDArray[np.int_] = self._calibration_kernel.get_heralded_state_0_measurement_index(element=qubit_id)
         elif state == StateKey.STATE_1:
-            single_cycle_indices: List[int] = self._calibration_kernel.get_heralded_state_1_measurement_index(element=qubit_id)
+            single_cycle_indices: NDArray[np.int_] = self._calibration_kernel.get_heralded_state_1_measurement_index(element=qubit_id)
         elif state == StateKey.STATE_2:
-            single_cycle_indices: List[int] = self._calibration_kernel.get_heralded_state_2_measurement_index(element=qubit_id)
+            single_cycle_indices: NDArray[np.int_] = self._calibration_kernel.get_heralded_state_2_measurement_index(element=qubit_id)
         else:
             raise NotImplementedError(f"Calibration conditional indices for state: {state}, is not implemented.")
         return self.create_sliced_array(single_cycle_indices, self.kernel_cycle_length, self.experiment_repetitions)
@@ -314,14 +314,14 @@ class RepetitionExperimentKernel(IStabilizerIndexingKernel):
 
     # TODO: Move this method to more general array transformation module
     @staticmethod
-    def create_sliced_arrays(int_list: List[int], cycle_length: int, repetitions: int) -> NDArray[np.int_]:
-        """Generate an array-like of numpy array by repeating and offsetting a list of integers based on cycle length and repetitions."""
+    def create_sliced_arrays(int_list: Union[List[int], NDArray[np.int_]], cycle_length: int, repetitions: int) -> NDArray[np.int_]:
+        """Generate an array-like of numpy array by repeating and offsetting an array-like of integers based on cycle length and repetitions."""
         return np.asarray([np.array(int_list) + i * cycle_length for i in range(repetitions)])
 
     # TODO: Move this method to more general array transformation module
     @staticmethod
-    def create_sliced_array(int_list: List[int], cycle_length: int, repetitions: int) -> NDArray[np.int_]:
-        """Generate a numpy array by repeating and offsetting a list of integers based on cycle length and repetitions."""
+    def create_sliced_array(int_list: NDArray[np.int_], cycle_length: int, repetitions: int) -> NDArray[np.int_]:
+        """Generate a numpy array by repeating and offsetting an array of integers based on cycle length and repetitions."""
         arrays: NDArray[np.int_] = RepetitionExperimentKernel.create_sliced_arrays(int_list, cycle_length, repetitions)
         return np.concatenate(arrays)
     # endregion
@@ -3,7 +3,7 @@
 # -------------------------------------------
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Type, Generic, TypeVar, List, Optional, Union
+from typing import Type, Generic, TypeVar, List, Dict, Set, Tuple, Sequence, Iterable, Optional, Union
 from tqdm import tqdm
 from qce_circuit.utilities.custom_exceptions import InterfaceMethodException
 from qce_circuit.language.intrf_declarative_circuit import IDeclarativeCircuit
@@ -23,12 +23,19 @@ from qce_circuit.structure.circuit_operations import (
 )
 from qce_circuit.structure.intrf_circuit_operation import (
     QubitChannel,
+    get_channel_identifier,
 )
 
 
 TMaskedOperation = TypeVar('TMaskedOperation', bound=SingleQubitOperation)
 TMaskedTwoQubitOperation = TypeVar('TMaskedTwoQubitOperation', bound=TwoQubitOperation)
 TMaskOperation = TypeVar('TMaskOperation', bound=ICircuitOperation)
+_MASKABLE_OPERATION_TYPES: Tuple[Type[ICircuitOperation], ...] = (SingleQubitOperation, DispersiveMeasure)
+"""Operation types considered by channel (vacant) masks."""
+_MASK_OPERATION_TYPES: Tuple[Type[ICircuitOperation], ...] = (VirtualVacant, VirtualEmpty)
+"""(Virtual) operation types constructed by channel (vacant) masks, these are not masked again."""
+_EMPTY_MASK_OPERATION_TYPES: Tuple[Type[ICircuitOperation], ...] = (VirtualPark, Wait)
+"""Operation types that are masked with a VirtualEmpty operation."""
 
 
 class IOperationMask(ABC, Generic[TMaskedOperation, TMaskOperation]):
@@ -36,6 +43,16 @@ class IOperationMask(ABC, Generic[TMaskedOperation, TMaskOperation]):
     Interface class, describing operation masking.
     """
 
+    # region Interface Properties
+    @property
+    def candidate_types(self) -> Tuple[Type[ICircuitOperation], ...]:
+        """
+        Defaults to all operation types, override to narrow down which operations are offered to match.
+        :return: Tuple of operation types (including subclasses) this mask can ever match.
+        """
+        return (ICircuitOperation,)
+    # endregion
+
     # region Interface Methods
     @abstractmethod
     def match(self, matched_operation: ICircuitOperation) -> bool:
@@ -49,30 +66,72 @@ class IOperationMask(ABC, Generic[TMaskedOperation, TMaskOperation]):
     # endregion
 
 
-def replace_operation(circuit: IDeclarativeCircuit, operation_masks: List[IOperationMask]) -> DeclarativeCircuit:
+def _remove_duplicate_masks(operation_masks: Iterable[IOperationMask]) -> List[IOperationMask]:
+    """
+    Duplicate masks would only be matched again after their first occurrence.
+    Unhashable masks are not compared and kept as-is.
+    :return: Array-like of operation masks, (hashable) duplicates removed while preserving order.
+    """
+    result: List[IOperationMask] = []
+    seen: Set[IOperationMask] = set()
+    for operation_mask in operation_masks:
+        try:
+            if operation_mask in seen:
+                continue
+            seen.add(operation_mask)
+        except TypeError:
+            pass
+        result.append(operation_mask)
+    return result
+
+
+def replace_operation(circuit: IDeclarativeCircuit, operation_masks: List[IOperationMask], progress: bool = False) -> DeclarativeCircuit:
     """
     Iterates over existing declarative circuit.
     Reconstructs and replaces based on operation mask.
+    Each operation is replaced by (at most) the first matching operation mask.
     :param circuit: Declarative circuit to be modified.
     :param operation_masks: Array-like of operation masks.
+    :param progress: (Optional) Whether to display a progress bar. Default False.
     :return: Newly constructed declarative circuit with modified operations.
     """
+    operation_masks = _remove_duplicate_masks(operation_masks)
     result = DeclarativeCircuit()
+    operation_copies: List[ICircuitOperation] = []
     relation_transfer_lookup = {}
+    # Lazily populated lookup from (concrete) operation type to masks that can match it
+    mask_dispatch_lookup: Dict[Type[ICircuitOperation], List[IOperationMask]] = {}
+
+    operations: List[ICircuitOperation] = circuit.operations
+    operation_iterator: Iterable[ICircuitOperation] = operations
+    if progress:
+        operation_iterator = tqdm(operations, desc="Replacing Circuit Operations", total=len(operations))
 
     # Iterate through nodes and rebuild circuit composite
-    for operation in tqdm(circuit.operations, desc="Replacing Circuit Operations"):
+    for operation in operation_iterator:
         operation_copy: ICircuitOperation = operation.copy(relation_transfer_lookup=relation_transfer_lookup)
 
-        for operation_mask in operation_masks:
+        operation_type: Type[ICircuitOperation] = type(operation_copy)
+        candidate_masks: Optional[List[IOperationMask]] = mask_dispatch_lookup.get(operation_type, None)
+        if candidate_masks is None:
+            candidate_masks = [
+                operation_mask
+                for operation_mask in operation_masks
+                if issubclass(operation_type, operation_mask.candidate_types)
+            ]
+            mask_dispatch_lookup[operation_type] = candidate_masks
+
+        # First matching mask wins, (virtual) mask-operations are not masked again.
+        for operation_mask in candidate_masks:
             if operation_mask.match(matched_operation=operation_copy):
                 operation_copy = operation_mask.construct_operation_mask(masked_operation=operation_copy)
+                break
 
         # Keep track of copied operations for relation transfer
         relation_transfer_lookup[operation] = operation_copy
-        result.add(operation_copy)
+        operation_copies.append(operation_copy)
 
-    return result
+    return result.add_operations(operation_copies)
 
 
 @dataclass(frozen=True)
@@ -80,6 +139,13 @@ class OperationVacantMask(IOperationMask[TMaskedOperation, VirtualVacant], Gener
     operation_type: Type[ICircuitOperation]
     qubit_index: int
 
+    # region Interface Properties
+    @property
+    def candidate_types(self) -> Tuple[Type[ICircuitOperation], ...]:
+        """:return: Tuple of operation types (including subclasses) this mask can ever match."""
+        return (self.operation_type,)
+    # endregion
+
     # region Interface Methods
     def match(self, matched_operation: TMaskedOperation) -> bool:
         """:return: Boolean whether matched operation should be masked or not."""
@@ -108,27 +174,35 @@ class ChannelVacantMask(IOperationMask[TMaskedOperation, Union[VirtualVacant, Vi
     @property
     def qubit_channel_identifier(self) -> ChannelIdentifier:
         """:return: Identifier for qubit index and channel type."""
-        return ChannelIdentifier(_id=self.qubit_index, _channel=self.qubit_channel)
+        return self._qubit_channel_identifier
+    # endregion
+
+    # region Interface Properties
+    @property
+    def candidate_types(self) -> Tuple[Type[ICircuitOperation], ...]:
+        """:return: Tuple of operation types (including subclasses) this mask can ever match."""
+        return _MASKABLE_OPERATION_TYPES
     # endregion
 
     # region Interface Methods
     def match(self, matched_operation: TMaskedOperation) -> bool:
         """:return: Boolean whether matched operation should be masked or not."""
-        is_masked_operation: bool = (isinstance(matched_operation, SingleQubitOperation)
-                                     or isinstance(matched_operation, DispersiveMeasure))
-        is_mask_operation: bool = (isinstance(matched_operation, VirtualVacant)
-                                   or isinstance(matched_operation, VirtualEmpty))
+        is_masked_operation: bool = isinstance(matched_operation, _MASKABLE_OPERATION_TYPES)
+        is_mask_operation: bool = isinstance(matched_operation, _MASK_OPERATION_TYPES)
         if not is_masked_operation or is_mask_operation:
             return False
-        is_masked_channel: bool = (self.qubit_channel_identifier in matched_operation.channel_identifiers
-                                   and QubitChannel.ALL not in [_id.channel for _id in matched_operation.channel_identifiers])
+        # Resolve (property) channel identifiers once and scan them in a single pass
+        channel_identifiers: Sequence[ChannelIdentifier] = matched_operation.channel_identifiers
+        occupies_all_channels: bool = any(_id.channel is QubitChannel.ALL for _id in channel_identifiers)
+        if occupies_all_channels:
+            return False
+        is_masked_channel: bool = self.qubit_channel_identifier in channel_identifiers
         return is_masked_channel
 
     def construct_operation_mask(self, masked_operation: TMaskedOperation) -> Union[VirtualVacant, VirtualEmpty]:
         """:return: Newly constructed 'mask'-operation based on masked-operation."""
         # Guard clause, some operations should be masked with a VirtualEmpty operation
-        requires_empty_mask: bool = (isinstance(masked_operation, VirtualPark)
-                                     or isinstance(masked_operation, Wait))
+        requires_empty_mask: bool = isinstance(masked_operation, _EMPTY_MASK_OPERATION_TYPES)
 
         if requires_empty_mask:
             return VirtualEmpty(
@@ -144,6 +218,12 @@ class ChannelVacantMask(IOperationMask[TMaskedOperation, Union[VirtualVacant, Vi
         )
     # endregion
 
+    # region Class Methods
+    def __post_init__(self):
+        # Mask is immutable, construct channel identifier once instead of on every match.
+        object.__setattr__(self, '_qubit_channel_identifier', get_channel_identifier(self.qubit_index, self.qubit_channel))
+    # endregion
+
 
 @dataclass(frozen=True)
 class ChannelTwoQubitVacantMask(IOperationMask[TMaskedTwoQubitOperation, VirtualTwoQubitVacant], Generic[TMaskedTwoQubitOperation]):
@@ -159,12 +239,16 @@ class ChannelTwoQubitVacantMask(IOperationMask[TMaskedTwoQubitOperation, Virtual
 
     # region Class Properties
     @property
-    def qubit_channel_identifiers(self) -> List[ChannelIdentifier]:
+    def qubit_channel_identifiers(self) -> Tuple[ChannelIdentifier, ...]:
         """:return: Identifier for qubit index and channel type."""
-        result: List[ChannelIdentifier] = [ChannelIdentifier(_id=self.control_qubit_index, _channel=self.qubit_channel)]
-        if self.target_qubit_index is not None:
-            result.append(ChannelIdentifier(_id=self.target_qubit_index, _channel=self.qubit_channel))
-        return result
+        return self._qubit_channel_identifiers
+    # endregion
+
+    # region Interface Properties
+    @property
+    def candidate_types(self) -> Tuple[Type[ICircuitOperation], ...]:
+        """:return: Tuple of operation types (including subclasses) this mask can ever match."""
+        return (TwoQubitOperation,)
     # endregion
 
     # region Interface Methods
@@ -174,11 +258,12 @@ class ChannelTwoQubitVacantMask(IOperationMask[TMaskedTwoQubitOperation, Virtual
         is_mask_operation: bool = isinstance(matched_operation, VirtualTwoQubitVacant)
         if not is_masked_operation or is_mask_operation:
             return False
-        is_masked_channel: bool = all([
-            identifier in matched_operation.channel_identifiers
-            for identifier in self.qubit_channel_identifiers
-        ])
-        return is_masked_channel
+        channel_identifiers: Sequence[ChannelIdentifier] = matched_operation.channel_identifiers
+        target_identifier: Optional[ChannelIdentifier] = self._target_channel_identifier
+        return (
+            self._control_channel_identifier in channel_identifiers and
+            (target_identifier is None or target_identifier in channel_identifiers)
+        )
 
     def construct_operation_mask(self, masked_operation: TMaskedTwoQubitOperation) -> VirtualTwoQubitVacant:
         """:return: Newly constructed 'mask'-operation based on masked-operation."""
@@ -189,3 +274,19 @@ class ChannelTwoQubitVacantMask(IOperationMask[TMaskedTwoQubitOperation, Virtual
             duration_strategy=masked_operation.duration_strategy,
         )
     # endregion
+
+    # region Class Methods
+    def __post_init__(self):
+        # Mask is immutable, construct channel identifiers once instead of on every match.
+        # Note: stored as tuple (not set), ChannelIdentifier equality treats QubitChannel.ALL as wildcard.
+        control_identifier: ChannelIdentifier = get_channel_identifier(self.control_qubit_index, self.qubit_channel)
+        target_identifier: Optional[ChannelIdentifier] = None
+        if self.target_qubit_index is not None:
+            target_identifier = get_channel_identifier(self.target_qubit_index, self.qubit_channel)
+        qubit_channel_identifiers: Tuple[ChannelIdentifier, ...] = (control_identifier,)
+        if target_identifier is not None:
+            qubit_channel_identifiers += (target_identifier,)
+        object.__setattr__(self, '_control_channel_identifier', control_identifier)
+        object.__setattr__(self, '_target_channel_identifier', target_identifier)
+        object.__setattr__(self, '_qubit_channel_identifiers', qubit_channel_identifiers)
+    # endregion
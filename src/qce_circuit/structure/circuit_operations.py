@@ -2,12 +2,13 @@
 # Module describing the declarative operations.
 # -------------------------------------------
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict
+from typing import List, Tuple, Optional, Dict, ClassVar
 from qce_circuit.structure.intrf_circuit_operation import (
     QubitChannel,
     IRelationLink,
     RelationLink,
     ChannelIdentifier,
+    get_channel_identifier,
     ICircuitOperation,
 )
 from qce_circuit.structure.intrf_acquisition_operation import (
@@ -25,22 +26,33 @@ from qce_circuit.structure.registry_acquisition import (
 )
 
 
-@dataclass(frozen=False, unsafe_hash=True)
+# Shared (immutable) default duration strategies.
+# Global strategies read the duration config on construction, construct them once instead of per class definition.
+_ZERO_DURATION: IDurationStrategy = FixedDurationStrategy(duration=0.0)
+_MICROWAVE_DURATION: IDurationStrategy = GlobalDurationStrategy(GlobalRegistryKey.MICROWAVE)
+_FLUX_DURATION: IDurationStrategy = GlobalDurationStrategy(GlobalRegistryKey.FLUX)
+_READOUT_DURATION: IDurationStrategy = GlobalDurationStrategy(GlobalRegistryKey.READOUT)
+_RESET_DURATION: IDurationStrategy = GlobalDurationStrategy(GlobalRegistryKey.RESET)
+
+
+@dataclass(frozen=False, eq=False)
 class SingleQubitOperation(ICircuitOperation):
     """
     Minimal operation describes single-qubit implementation of ICircuitOperation.
     """
     qubit_index: int = field(init=True)
     relation: IRelationLink[ICircuitOperation] = field(default_factory=RelationLink.no_relation)
-    duration_strategy: IDurationStrategy = field(default=FixedDurationStrategy(duration=0.0))
+    duration_strategy: IDurationStrategy = field(default=_ZERO_DURATION)
+    _channel_identifiers: Tuple[ChannelIdentifier, ...] = field(init=False, repr=False, compare=False)
+    """Cached channel identifiers, derived once during post-init. Construction fields are read-only afterwards."""
+    _qubit_channel: ClassVar[QubitChannel] = QubitChannel.ALL
+    """Qubit channel occupied by this operation type. Overwritten by (fixed) channel specific operation types."""
 
     # region Interface Properties
     @property
-    def channel_identifiers(self) -> List[ChannelIdentifier]:
+    def channel_identifiers(self) -> Tuple[ChannelIdentifier, ...]:
         """:return: Array-like of channel identifiers to which this operation applies to."""
-        return [
-            ChannelIdentifier(_id=self.qubit_index, _channel=QubitChannel.ALL),
-        ]
+        return self._channel_identifiers
 
     @property
     def nr_of_repetitions(self) -> int:
@@ -60,7 +72,7 @@ class SingleQubitOperation(ICircuitOperation):
     @property
     def start_time(self) -> float:
         """:return: Start time [a.u.]."""
-        return self.relation_link.get_start_time(duration=self.duration)
+        return self.relation_link.get_start_time(self.duration)
 
     @property
     def duration(self) -> float:
@@ -89,13 +101,13 @@ class SingleQubitOperation(ICircuitOperation):
         """
         return self
 
-    def decomposed_operations(self) -> List[ICircuitOperation]:
+    def decomposed_operations(self) -> Tuple[ICircuitOperation, ...]:
         """
         Functions similar to a 'flatten' operation.
         Mostly intended for composite-operations such that they can apply repetition and state-dependent registries.
         :return: Array-like of decomposed operations.
         """
-        return [self]
+        return (self,)
 
     def apply_flatten_to_self(self) -> ICircuitOperation:
         """
@@ -105,22 +117,24 @@ class SingleQubitOperation(ICircuitOperation):
         return self
     # endregion
 
+    # region Class Methods
+    def _construct_channel_identifiers(self) -> Tuple[ChannelIdentifier, ...]:
+        """:return: Array-like of channel identifiers to which this operation applies to."""
+        return (
+            get_channel_identifier(self.qubit_index, self._qubit_channel),
+        )
+
+    def __post_init__(self):
+        self._channel_identifiers = self._construct_channel_identifiers()
+    # endregion
+
 
-@dataclass(frozen=False, unsafe_hash=True)
+@dataclass(frozen=False, eq=False)
 class Reset(SingleQubitOperation, ICircuitOperation):
     """
     Reset operation covers all qubit channels.
     """
-    duration_strategy: IDurationStrategy = field(init=False, default=GlobalDurationStrategy(GlobalRegistryKey.RESET))
-
-    # region Interface Properties
-    @property
-    def channel_identifiers(self) -> List[ChannelIdentifier]:
-        """:return: Array-like of channel identifiers to which this operation applies to."""
-        return [
-            ChannelIdentifier(_id=self.qubit_index, _channel=QubitChannel.ALL),
-        ]
-    # endregion
+    duration_strategy: IDurationStrategy = field(init=False, default=_RESET_DURATION)
 
     # region Interface Methods
     def copy(self, relation_transfer_lookup: Optional[Dict[ICircuitOperation, ICircuitOperation]] = None) -> 'Reset':
@@ -136,23 +150,14 @@ class Reset(SingleQubitOperation, ICircuitOperation):
     # endregion
 
 
-@dataclass(frozen=False, unsafe_hash=True)
+@dataclass(frozen=False, eq=False)
 class Wait(SingleQubitOperation, ICircuitOperation):
     """
     Wait (delay) operation.
     Allow to wait on specific (qubit) channel.
     """
     qubit_channel: QubitChannel = field(init=True, default=QubitChannel.ALL)
-    duration_strategy: IDurationStrategy = field(init=True, default=FixedDurationStrategy(duration=0.0))
-
-    # region Interface Properties
-    @property
-    def channel_identifiers(self) -> List[ChannelIdentifier]:
-        """:return: Array-like of channel identifiers to which this operation applies to."""
-        return [
-            ChannelIdentifier(_id=self.qubit_index, _channel=self.qubit_channel),
-        ]
-    # endregion
+    duration_strategy: IDurationStrategy = field(init=True, default=_ZERO_DURATION)
 
     # region Interface Methods
     def copy(self, relation_transfer_lookup: Optional[Dict[ICircuitOperation, ICircuitOperation]] = None) -> 'Wait':
@@ -169,22 +174,22 @@ class Wait(SingleQubitOperation, ICircuitOperation):
         )
     # endregion
 
+    # region Class Methods
+    def _construct_channel_identifiers(self) -> Tuple[ChannelIdentifier, ...]:
+        """:return: Array-like of channel identifiers to which this operation applies to."""
+        return (
+            get_channel_identifier(self.qubit_index, self.qubit_channel),
+        )
+    # endregion
+
 
-@dataclass(frozen=False, unsafe_hash=True)
+@dataclass(frozen=False, eq=False)
 class Identity(SingleQubitOperation, ICircuitOperation):
     """
     Identity operation.
     """
-    duration_strategy: IDurationStrategy = field(init=False, default=GlobalDurationStrategy(GlobalRegistryKey.MICROWAVE))
-
-    # region Interface Properties
-    @property
-    def channel_identifiers(self) -> List[ChannelIdentifier]:
-        """:return: Array-like of channel identifiers to which this operation applies to."""
-        return [
-            ChannelIdentifier(_id=self.qubit_index, _channel=QubitChannel.MICROWAVE),
-        ]
-    # endregion
+    duration_strategy: IDurationStrategy = field(init=False, default=_MICROWAVE_DURATION)
+    _qubit_channel: ClassVar[QubitChannel] = QubitChannel.MICROWAVE
 
     # region Interface Methods
     def copy(self, relation_transfer_lookup: Optional[Dict[ICircuitOperation, ICircuitOperation]] = None) -> 'Identity':
@@ -200,21 +205,13 @@ class Identity(SingleQubitOperation, ICircuitOperation):
     # endregion
 
 
-@dataclass(frozen=False, unsafe_hash=True)
+@dataclass(frozen=False, eq=False)
 class Hadamard(SingleQubitOperation, ICircuitOperation):
     """
     Hadamard operation.
     """
-    duration_strategy: IDurationStrategy = field(init=False, default=GlobalDurationStrategy(GlobalRegistryKey.MICROWAVE))
-
-    # region Interface Properties
-    @property
-    def channel_identifiers(self) -> List[ChannelIdentifier]:
-        """:return: Array-like of channel identifiers to which this operation applies to."""
-        return [
-            ChannelIdentifier(_id=self.qubit_index, _channel=QubitChannel.MICROWAVE),
-        ]
-    # endregion
+    duration_strategy: IDurationStrategy = field(init=False, default=_MICROWAVE_DURATION)
+    _qubit_channel: ClassVar[QubitChannel] = QubitChannel.MICROWAVE
 
     # region Interface Methods
     def copy(self, relation_transfer_lookup: Optional[Dict[ICircuitOperation, ICircuitOperation]] = None) -> 'Hadamard':
@@ -230,21 +227,13 @@ class Hadamard(SingleQubitOperation, ICircuitOperation):
     # endregion
 
 
-@dataclass(frozen=False, unsafe_hash=True)
+@dataclass(frozen=False, eq=False)
 class Rx180(SingleQubitOperation, ICircuitOperation):
     """
     Rotation-X (180 degrees) operation.
     """
-    duration_strategy: IDurationStrategy = field(init=False, default=GlobalDurationStrategy(GlobalRegistryKey.MICROWAVE))
-
-    # region Interface Properties
-    @property
-    def channel_identifiers(self) -> List[ChannelIdentifier]:
-        """:return: Array-like of channel identifiers to which this operation applies to."""
-        return [
-            ChannelIdentifier(_id=self.qubit_index, _channel=QubitChannel.MICROWAVE),
-        ]
-    # endregion
+    duration_strategy: IDurationStrategy = field(init=False, default=_MICROWAVE_DURATION)
+    _qubit_channel: ClassVar[QubitChannel] = QubitChannel.MICROWAVE
 
     # region Interface Methods
     def copy(self, relation_transfer_lookup: Optional[Dict[ICircuitOperation, ICircuitOperation]] = None) -> 'Rx180':
@@ -260,21 +249,13 @@ class Rx180(SingleQubitOperation, ICircuitOperation):
     # endregion
 
 
-@dataclass(frozen=False, unsafe_hash=True)
+@dataclass(frozen=False, eq=False)
 class Rx90(SingleQubitOperation, ICircuitOperation):
     """
     Rotation-X (90 degrees) operation.
     """
-    duration_strategy: IDurationStrategy = field(init=False, default=GlobalDurationStrategy(GlobalRegistryKey.MICROWAVE))
-
-    # region Interface Properties
-    @property
-    def channel_identifiers(self) -> List[ChannelIdentifier]:
-        """:return: Array-like of channel identifiers to which this operation applies to."""
-        return [
-            ChannelIdentifier(_id=self.qubit_index, _channel=QubitChannel.MICROWAVE),
-        ]
-    # endregion
+    duration_strategy: IDurationStrategy = field(init=False, default=_MICROWAVE_DURATION)
+    _qubit_channel: ClassVar[QubitChannel] = QubitChannel.MICROWAVE
 
     # region Interface Methods
     def copy(self, relation_transfer_lookup: Optional[Dict[ICircuitOperation, ICircuitOperation]] = None) -> 'Rx90':
@@ -290,21 +271,13 @@ class Rx90(SingleQubitOperation, ICircuitOperation):
     # endregion
 
 
-@dataclass(frozen=False, unsafe_hash=True)
+@dataclass(frozen=False, eq=False)
 class Rxm90(SingleQubitOperation, ICircuitOperation):
     """
     Rotation-X (-90 degrees) operation.
     """
-    duration_strategy: IDurationStrategy = field(init=False, default=GlobalDurationStrategy(GlobalRegistryKey.MICROWAVE))
-
-    # region Interface Properties
-    @property
-    def channel_identifiers(self) -> List[ChannelIdentifier]:
-        """:return: Array-like of channel identifiers to which this operation applies to."""
-        return [
-            ChannelIdentifier(_id=self.qubit_index, _channel=QubitChannel.MICROWAVE),
-        ]
-    # endregion
+    duration_strategy: IDurationStrategy = field(init=False, default=_MICROWAVE_DURATION)
+    _qubit_channel: ClassVar[QubitChannel] = QubitChannel.MICROWAVE
 
     # region Interface Methods
     def copy(self, relation_transfer_lookup: Optional[Dict[ICircuitOperation, ICircuitOperation]] = None) -> 'Rxm90':
@@ -320,21 +293,13 @@ class Rxm90(SingleQubitOperation, ICircuitOperation):
     # endregion
 
 
-@dataclass(frozen=False, unsafe_hash=True)
+@dataclass(frozen=False, eq=False)
 class Ry180(SingleQubitOperation, ICircuitOperation):
     """
     Rotation-Y (180 degrees) operation.
     """
-    duration_strategy: IDurationStrategy = field(init=False, default=GlobalDurationStrategy(GlobalRegistryKey.MICROWAVE))
-
-    # region Interface Properties
-    @property
-    def channel_identifiers(self) -> List[ChannelIdentifier]:
-        """:return: Array-like of channel identifiers to which this operation applies to."""
-        return [
-            ChannelIdentifier(_id=self.qubit_index, _channel=QubitChannel.MICROWAVE),
-        ]
-    # endregion
+    duration_strategy: IDurationStrategy = field(init=False, default=_MICROWAVE_DURATION)
+    _qubit_channel: ClassVar[QubitChannel] = QubitChannel.MICROWAVE
 
     # region Interface Methods
     def copy(self, relation_transfer_lookup: Optional[Dict[ICircuitOperation, ICircuitOperation]] = None) -> 'Ry180':
@@ -350,21 +315,13 @@ class Ry180(SingleQubitOperation, ICircuitOperation):
     # endregion
 
 
-@dataclass(frozen=False, unsafe_hash=True)
+@dataclass(frozen=False, eq=False)
 class Ry90(SingleQubitOperation, ICircuitOperation):
     """
     Rotation-Y (90 degrees) operation.
     """
-    duration_strategy: IDurationStrategy = field(init=False, default=GlobalDurationStrategy(GlobalRegistryKey.MICROWAVE))
-
-    # region Interface Properties
-    @property
-    def channel_identifiers(self) -> List[ChannelIdentifier]:
-        """:return: Array-like of channel identifiers to which this operation applies to."""
-        return [
-            ChannelIdentifier(_id=self.qubit_index, _channel=QubitChannel.MICROWAVE),
-        ]
-    # endregion
+    duration_strategy: IDurationStrategy = field(init=False, default=_MICROWAVE_DURATION)
+    _qubit_channel: ClassVar[QubitChannel] = QubitChannel.MICROWAVE
 
     # region Interface Methods
     def copy(self, relation_transfer_lookup: Optional[Dict[ICircuitOperation, ICircuitOperation]] = None) -> 'Ry90':
@@ -380,21 +337,13 @@ class Ry90(SingleQubitOperation, ICircuitOperation):
     # endregion
 
 
-@dataclass(frozen=False, unsafe_hash=True)
+@dataclass(frozen=False, eq=False)
 class Rym90(SingleQubitOperation, ICircuitOperation):
     """
     Rotation-Y (-90 degrees) operation.
     """
-    duration_strategy: IDurationStrategy = field(init=False, default=GlobalDurationStrategy(GlobalRegistryKey.MICROWAVE))
-
-    # region Interface Properties
-    @property
-    def channel_identifiers(self) -> List[ChannelIdentifier]:
-        """:return: Array-like of channel identifiers to which this operation applies to."""
-        return [
-            ChannelIdentifier(_id=self.qubit_index, _channel=QubitChannel.MICROWAVE),
-        ]
-    # endregion
+    duration_strategy: IDurationStrategy = field(init=False, default=_MICROWAVE_DURATION)
+    _qubit_channel: ClassVar[QubitChannel] = QubitChannel.MICROWAVE
 
     # region Interface Methods
     def copy(self, relation_transfer_lookup: Optional[Dict[ICircuitOperation, ICircuitOperation]] = None) -> 'Rym90':
@@ -410,21 +359,13 @@ class Rym90(SingleQubitOperation, ICircuitOperation):
     # endregion
 
 
-@dataclass(frozen=False, unsafe_hash=True)
+@dataclass(frozen=False, eq=False)
 class Rx180ef(SingleQubitOperation, ICircuitOperation):
     """
     Rotation-X (180 degrees) operation between excited (e) and second-excited (f) state.
     """
-    duration_strategy: IDurationStrategy = field(init=False, default=GlobalDurationStrategy(GlobalRegistryKey.MICROWAVE))
-
-    # region Interface Properties
-    @property
-    def channel_identifiers(self) -> List[ChannelIdentifier]:
-        """:return: Array-like of channel identifiers to which this operation applies to."""
-        return [
-            ChannelIdentifier(_id=self.qubit_index, _channel=QubitChannel.MICROWAVE),
-        ]
-    # endregion
+    duration_strategy: IDurationStrategy = field(init=False, default=_MICROWAVE_DURATION)
+    _qubit_channel: ClassVar[QubitChannel] = QubitChannel.MICROWAVE
 
     # region Interface Methods
     def copy(self, relation_transfer_lookup: Optional[Dict[ICircuitOperation, ICircuitOperation]] = None) -> 'Rx180ef':
@@ -440,21 +381,13 @@ class Rx180ef(SingleQubitOperation, ICircuitOperation):
     # endregion
 
 
-@dataclass(frozen=False, unsafe_hash=True)
+@dataclass(frozen=False, eq=False)
 class VirtualPhase(SingleQubitOperation, ICircuitOperation):
     """
     Virtual (Z) phase rotation operation.
     """
-    duration_strategy: IDurationStrategy = field(init=False, default=GlobalDurationStrategy(GlobalRegistryKey.MICROWAVE))
-
-    # region Interface Properties
-    @property
-    def channel_identifiers(self) -> List[ChannelIdentifier]:
-        """:return: Array-like of channel identifiers to which this operation applies to."""
-        return [
-            ChannelIdentifier(_id=self.qubit_index, _channel=QubitChannel.MICROWAVE),
-        ]
-    # endregion
+    duration_strategy: IDurationStrategy = field(init=False, default=_MICROWAVE_DURATION)
+    _qubit_channel: ClassVar[QubitChannel] = QubitChannel.MICROWAVE
 
     # region Interface Methods
     def copy(self, relation_transfer_lookup: Optional[Dict[ICircuitOperation, ICircuitOperation]] = None) -> 'VirtualPhase':
@@ -470,22 +403,14 @@ class VirtualPhase(SingleQubitOperation, ICircuitOperation):
     # endregion
 
 
-@dataclass(frozen=False, unsafe_hash=True)
+@dataclass(frozen=False, eq=False)
 class VirtualPark(SingleQubitOperation, ICircuitOperation):
     """
     Virtual park operation.
     Usually only interesting when working with frequency-tunable qubits.
     """
-    duration_strategy: IDurationStrategy = field(init=False, default=GlobalDurationStrategy(GlobalRegistryKey.FLUX))
-
-    # region Interface Properties
-    @property
-    def channel_identifiers(self) -> List[ChannelIdentifier]:
-        """:return: Array-like of channel identifiers to which this operation applies to."""
-        return [
-            ChannelIdentifier(_id=self.qubit_index, _channel=QubitChannel.FLUX),
-        ]
-    # endregion
+    duration_strategy: IDurationStrategy = field(init=False, default=_FLUX_DURATION)
+    _qubit_channel: ClassVar[QubitChannel] = QubitChannel.FLUX
 
     # region Interface Methods
     def copy(self, relation_transfer_lookup: Optional[Dict[ICircuitOperation, ICircuitOperation]] = None) -> 'VirtualPark':
@@ -501,21 +426,13 @@ class VirtualPark(SingleQubitOperation, ICircuitOperation):
     # endregion
 
 
-@dataclass(frozen=False, unsafe_hash=True)
+@dataclass(frozen=False, eq=False)
 class Rphi90(SingleQubitOperation, ICircuitOperation):
     """
     Rotation- [Xcos(phi) + Ysin(phi)] (90 degrees) operation.
     """
-    duration_strategy: IDurationStrategy = field(init=False, default=GlobalDurationStrategy(GlobalRegistryKey.MICROWAVE))
-
-    # region Interface Properties
-    @property
-    def channel_identifiers(self) -> List[ChannelIdentifier]:
-        """:return: Array-like of channel identifiers to which this operation applies to."""
-        return [
-            ChannelIdentifier(_id=self.qubit_index, _channel=QubitChannel.MICROWAVE),
-        ]
-    # endregion
+    duration_strategy: IDurationStrategy = field(init=False, default=_MICROWAVE_DURATION)
+    _qubit_channel: ClassVar[QubitChannel] = QubitChannel.MICROWAVE
 
     # region Interface Methods
     def copy(self, relation_transfer_lookup: Optional[Dict[ICircuitOperation, ICircuitOperation]] = None) -> 'Rphi90':
@@ -531,7 +448,7 @@ class Rphi90(SingleQubitOperation, ICircuitOperation):
     # endregion
 
 
-@dataclass(frozen=False, unsafe_hash=True)
+@dataclass(frozen=False, eq=False)
 class TwoQubitOperation(ICircuitOperation):
     """
     Minimal operation describes two-qubit implementation of ICircuitOperation.
@@ -539,16 +456,15 @@ class TwoQubitOperation(ICircuitOperation):
     control_qubit_index: int = field(init=True)
     target_qubit_index: int = field(init=True)
     relation: IRelationLink[ICircuitOperation] = field(default_factory=RelationLink.no_relation)
-    duration_strategy: IDurationStrategy = field(default=FixedDurationStrategy(duration=0.0))
+    duration_strategy: IDurationStrategy = field(default=_ZERO_DURATION)
+    _channel_identifiers: Tuple[ChannelIdentifier, ...] = field(init=False, repr=False, compare=False)
+    """Cached channel identifiers, derived once during post-init. Construction fields are read-only afterwards."""
 
     # region Interface Properties
     @property
-    def channel_identifiers(self) -> List[ChannelIdentifier]:
+    def channel_identifiers(self) -> Tuple[ChannelIdentifier, ...]:
         """:return: Array-like of channel identifiers to which this operation applies to."""
-        return [
-            ChannelIdentifier(_id=self.control_qubit_index, _channel=QubitChannel.ALL),
-            ChannelIdentifier(_id=self.target_qubit_index, _channel=QubitChannel.ALL),
-        ]
+        return self._channel_identifiers
 
     @property
     def nr_of_repetitions(self) -> int:
@@ -568,7 +484,7 @@ class TwoQubitOperation(ICircuitOperation):
     @property
     def start_time(self) -> float:
         """:return: Start time [a.u.]."""
-        return self.relation_link.get_start_time(duration=self.duration)
+        return self.relation_link.get_start_time(self.duration)
 
     @property
     def duration(self) -> float:
@@ -598,13 +514,13 @@ class TwoQubitOperation(ICircuitOperation):
         """
         return self
 
-    def decomposed_operations(self) -> List[ICircuitOperation]:
+    def decomposed_operations(self) -> Tuple[ICircuitOperation, ...]:
         """
         Functions similar to a 'flatten' operation.
         Mostly intended for composite-operations such that they can apply repetition and state-dependent registries.
         :return: Array-like of decomposed operations.
         """
-        return [self]
+        return (self,)
 
     def apply_flatten_to_self(self) -> ICircuitOperation:
         """
@@ -614,25 +530,25 @@ class TwoQubitOperation(ICircuitOperation):
         return self
     # endregion
 
+    # region Class Methods
+    def _construct_channel_identifiers(self) -> Tuple[ChannelIdentifier, ...]:
+        """:return: Array-like of channel identifiers to which this operation applies to."""
+        return (
+            get_channel_identifier(self.control_qubit_index, QubitChannel.ALL),
+            get_channel_identifier(self.target_qubit_index, QubitChannel.ALL),
+        )
 
-@dataclass(frozen=False, unsafe_hash=True)
+    def __post_init__(self):
+        self._channel_identifiers = self._construct_channel_identifiers()
+    # endregion
+
+
+@dataclass(frozen=False, eq=False)
 class CPhase(TwoQubitOperation, ICircuitOperation):
     """
     Control-Phase operation.
     """
-    duration_strategy: IDurationStrategy = field(init=False, default=GlobalDurationStrategy(GlobalRegistryKey.FLUX))
-
-    # region Interface Properties
-    @property
-    def channel_identifiers(self) -> List[ChannelIdentifier]:
-        """:return: Array-like of channel identifiers to which this operation applies to."""
-        return [
-            ChannelIdentifier(_id=self.control_qubit_index, _channel=QubitChannel.FLUX),
-            ChannelIdentifier(_id=self.control_qubit_index, _channel=QubitChannel.MICROWAVE),
-            ChannelIdentifier(_id=self.target_qubit_index, _channel=QubitChannel.FLUX),
-            ChannelIdentifier(_id=self.target_qubit_index, _channel=QubitChannel.MICROWAVE),
-        ]
-    # endregion
+    duration_strategy: IDurationStrategy = field(init=False, default=_FLUX_DURATION)
 
     # region Interface Methods
     def copy(self, relation_transfer_lookup: Optional[Dict[ICircuitOperation, ICircuitOperation]] = None) -> 'CPhase':
@@ -648,23 +564,24 @@ class CPhase(TwoQubitOperation, ICircuitOperation):
         )
     # endregion
 
+    # region Class Methods
+    def _construct_channel_identifiers(self) -> Tuple[ChannelIdentifier, ...]:
+        """:return: Array-like of channel identifiers to which this operation applies to."""
+        return (
+            get_channel_identifier(self.control_qubit_index, QubitChannel.FLUX),
+            get_channel_identifier(self.control_qubit_index, QubitChannel.MICROWAVE),
+            get_channel_identifier(self.target_qubit_index, QubitChannel.FLUX),
+            get_channel_identifier(self.target_qubit_index, QubitChannel.MICROWAVE),
+        )
+    # endregion
 
-@dataclass(frozen=False, unsafe_hash=True)
+
+@dataclass(frozen=False, eq=False)
 class TwoQubitVirtualPhase(TwoQubitOperation, ICircuitOperation):
     """
     Virtual (Z) phase rotation operation.
     """
-    duration_strategy: IDurationStrategy = field(init=False, default=FixedDurationStrategy(duration=0.0))
-
-    # region Interface Properties
-    @property
-    def channel_identifiers(self) -> List[ChannelIdentifier]:
-        """:return: Array-like of channel identifiers to which this operation applies to."""
-        return [
-            ChannelIdentifier(_id=self.control_qubit_index, _channel=QubitChannel.MICROWAVE),
-            ChannelIdentifier(_id=self.target_qubit_index, _channel=QubitChannel.MICROWAVE),
-        ]
-    # endregion
+    duration_strategy: IDurationStrategy = field(init=False, default=_ZERO_DURATION)
 
     # region Interface Methods
     def copy(self, relation_transfer_lookup: Optional[Dict[ICircuitOperation, ICircuitOperation]] = None) -> 'TwoQubitVirtualPhase':
@@ -680,8 +597,17 @@ class TwoQubitVirtualPhase(TwoQubitOperation, ICircuitOperation):
         )
     # endregion
 
+    # region Class Methods
+    def _construct_channel_identifiers(self) -> Tuple[ChannelIdentifier, ...]:
+        """:return: Array-like of channel identifiers to which this operation applies to."""
+        return (
+            get_channel_identifier(self.control_qubit_index, QubitChannel.MICROWAVE),
+            get_channel_identifier(self.target_qubit_index, QubitChannel.MICROWAVE),
+        )
+    # endregion
+
 
-@dataclass(frozen=False, unsafe_hash=True)
+@dataclass(frozen=False, eq=False)
 class DispersiveMeasure(IAcquisitionOperation):
     """
     Dispersive measure operation.
@@ -690,16 +616,16 @@ class DispersiveMeasure(IAcquisitionOperation):
     acquisition_strategy: IAcquisitionStrategy = field(init=True, repr=False)
     acquisition_tag: str = field(init=True, default='', repr=True)
     relation: IRelationLink[ICircuitOperation] = field(default_factory=RelationLink.no_relation, repr=False)
-    duration_strategy: IDurationStrategy = field(init=False, default=GlobalDurationStrategy(GlobalRegistryKey.READOUT), repr=False)
+    duration_strategy: IDurationStrategy = field(init=False, default=_READOUT_DURATION, repr=False)
     _acquisition_identifier: AcquisitionIdentifier = field(init=False, repr=False)
+    _channel_identifiers: Tuple[ChannelIdentifier, ...] = field(init=False, repr=False, compare=False)
+    """Cached channel identifiers, derived once during post-init. Construction fields are read-only afterwards."""
 
     # region Interface Properties
     @property
-    def channel_identifiers(self) -> List[ChannelIdentifier]:
+    def channel_identifiers(self) -> Tuple[ChannelIdentifier, ...]:
         """:return: Array-like of channel identifiers to which this operation applies to."""
-        return [
-            ChannelIdentifier(_id=self.qubit_index, _channel=QubitChannel.READOUT),
-        ]
+        return self._channel_identifiers
 
     @property
     def nr_of_repetitions(self) -> int:
@@ -719,7 +645,7 @@ class DispersiveMeasure(IAcquisitionOperation):
     @property
     def start_time(self) -> float:
         """:return: Start time [a.u.]."""
-        return self.relation_link.get_start_time(duration=self.duration)
+        return self.relation_link.get_start_time(self.duration)
 
     @property
     def duration(self) -> float:
@@ -770,13 +696,13 @@ class DispersiveMeasure(IAcquisitionOperation):
         """
         return self
 
-    def decomposed_operations(self) -> List[IAcquisitionOperation]:
+    def decomposed_operations(self) -> Tuple[IAcquisitionOperation, ...]:
         """
         Functions similar to a 'flatten' operation.
         Mostly intended for composite-operations such that they can apply repetition and state-dependent registries.
         :return: Array-like of decomposed operations.
         """
-        return [self]
+        return (self,)
 
     def apply_flatten_to_self(self) -> ICircuitOperation:
         """
@@ -788,30 +714,33 @@ class DispersiveMeasure(IAcquisitionOperation):
 
     # region Class Methods
     def __post_init__(self):
-        object.__setattr__(self, '_acquisition_identifier', AcquisitionIdentifier(
+        self._acquisition_identifier = AcquisitionIdentifier(
             qubit_index=self.qubit_index,
             tag=self.acquisition_tag,
-        ))
+        )
+        self._channel_identifiers = (
+            get_channel_identifier(self.qubit_index, QubitChannel.READOUT),
+        )
     # endregion
 
 
-@dataclass(frozen=False)
+@dataclass(frozen=False, eq=False)
 class Barrier(ICircuitOperation):
     """
     Multi-qubit barrier operation. Forces time-wise separation of operations.
     """
     qubit_indices: List[int] = field(init=True)
+    """Array-like of qubit indices. Read-only after construction, shared (by reference) between copies."""
     relation: IRelationLink[ICircuitOperation] = field(init=False, default_factory=RelationLink.no_relation)
     duration_strategy: IDurationStrategy = field(init=False, default=FixedDurationStrategy(duration=0.5))
+    _channel_identifiers: Tuple[ChannelIdentifier, ...] = field(init=False, repr=False, compare=False)
+    """Cached channel identifiers, derived once during post-init. Construction fields are read-only afterwards."""
 
     # region Interface Properties
     @property
-    def channel_identifiers(self) -> List[ChannelIdentifier]:
+    def channel_identifiers(self) -> Tuple[ChannelIdentifier, ...]:
         """:return: Array-like of channel identifiers to which this operation applies to."""
-        return [
-            ChannelIdentifier(_id=qubit_index, _channel=QubitChannel.ALL)
-            for qubit_index in self.qubit_indices
-        ]
+        return self._channel_identifiers
 
     @property
     def nr_of_repetitions(self) -> int:
@@ -831,7 +760,7 @@ class Barrier(ICircuitOperation):
     @property
     def start_time(self) -> float:
         """:return: Start time [a.u.]."""
-        return self.relation_link.get_start_time(duration=self.duration)
+        return self.relation_link.get_start_time(self.duration)
 
     @property
     def duration(self) -> float:
@@ -858,13 +787,13 @@ class Barrier(ICircuitOperation):
         """
         return self
 
-    def decomposed_operations(self) -> List[ICircuitOperation]:
+    def decomposed_operations(self) -> Tuple[ICircuitOperation, ...]:
         """
         Functions similar to a 'flatten' operation.
         Mostly intended for composite-operations such that they can apply repetition and state-dependent registries.
         :return: Array-like of decomposed operations.
         """
-        return [self]
+        return (self,)
 
     def apply_flatten_to_self(self) -> ICircuitOperation:
         """
@@ -875,13 +804,15 @@ class Barrier(ICircuitOperation):
     # endregion
 
     # region Class Methods
-    def __hash__(self):
-        """Overwrites @dataclass behaviour. Circuit operation requires hash based on instance identity."""
-        return id(self)
+    def __post_init__(self):
+        self._channel_identifiers = tuple(
+            get_channel_identifier(qubit_index, QubitChannel.ALL)
+            for qubit_index in self.qubit_indices
+        )
     # endregion
 
 
-@dataclass(frozen=False, unsafe_hash=True)
+@dataclass(frozen=False, eq=False)
 class VirtualVacant(SingleQubitOperation, ICircuitOperation):
     """
     Virtual vacant operation (behaves as Wait).
@@ -889,15 +820,6 @@ class VirtualVacant(SingleQubitOperation, ICircuitOperation):
     """
     qubit_channel: QubitChannel = field(init=True, default=QubitChannel.ALL)
 
-    # region Interface Properties
-    @property
-    def channel_identifiers(self) -> List[ChannelIdentifier]:
-        """:return: Array-like of channel identifiers to which this operation applies to."""
-        return [
-            ChannelIdentifier(_id=self.qubit_index, _channel=self.qubit_channel),
-        ]
-    # endregion
-
     # region Interface Methods
     def copy(self, relation_transfer_lookup: Optional[Dict[ICircuitOperation, ICircuitOperation]] = None) -> 'VirtualVacant':
         """
@@ -913,8 +835,16 @@ class VirtualVacant(SingleQubitOperation, ICircuitOperation):
         )
     # endregion
 
+    # region Class Methods
+    def _construct_channel_identifiers(self) -> Tuple[ChannelIdentifier, ...]:
+        """:return: Array-like of channel identifiers to which this operation applies to."""
+        return (
+            get_channel_identifier(self.qubit_index, self.qubit_channel),
+        )
+    # endregion
+
 
-@dataclass(frozen=False, unsafe_hash=True)
+@dataclass(frozen=False, eq=False)
 class VirtualTwoQubitVacant(TwoQubitOperation, ICircuitOperation):
     """
     Virtual vacant operation (behaves as TwoQubitOperation).
@@ -922,16 +852,6 @@ class VirtualTwoQubitVacant(TwoQubitOperation, ICircuitOperation):
     """
     qubit_channel: QubitChannel = field(init=True, default=QubitChannel.ALL)
 
-    # region Interface Properties
-    @property
-    def channel_identifiers(self) -> List[ChannelIdentifier]:
-        """:return: Array-like of channel identifiers to which this operation applies to."""
-        return [
-            ChannelIdentifier(_id=self.control_qubit_index, _channel=self.qubit_channel),
-            ChannelIdentifier(_id=self.target_qubit_index, _channel=self.qubit_channel),
-        ]
-    # endregion
-
     # region Interface Methods
     def copy(self, relation_transfer_lookup: Optional[Dict[ICircuitOperation, ICircuitOperation]] = None) -> 'VirtualTwoQubitVacant':
         """
@@ -946,8 +866,17 @@ class VirtualTwoQubitVacant(TwoQubitOperation, ICircuitOperation):
         )
     # endregion
 
+    # region Class Methods
+    def _construct_channel_identifiers(self) -> Tuple[ChannelIdentifier, ...]:
+        """:return: Array-like of channel identifiers to which this operation applies to."""
+        return (
+            get_channel_identifier(self.control_qubit_index, self.qubit_channel),
+            get_channel_identifier(self.target_qubit_index, self.qubit_channel),
+        )
+    # endregion
 
-@dataclass(frozen=False, unsafe_hash=True)
+
+@dataclass(frozen=False, eq=False)
 class VirtualEmpty(SingleQubitOperation, ICircuitOperation):
     """
     Virtual empty position (behaves as Wait).
@@ -955,15 +884,6 @@ class VirtualEmpty(SingleQubitOperation, ICircuitOperation):
     """
     qubit_channel: QubitChannel = field(init=True, default=QubitChannel.ALL)
 
-    # region Interface Properties
-    @property
-    def channel_identifiers(self) -> List[ChannelIdentifier]:
-        """:return: Array-like of channel identifiers to which this operation applies to."""
-        return [
-            ChannelIdentifier(_id=self.qubit_index, _channel=self.qubit_channel),
-        ]
-    # endregion
-
     # region Interface Methods
     def copy(self, relation_transfer_lookup: Optional[Dict[ICircuitOperation, ICircuitOperation]] = None) -> 'VirtualEmpty':
         """
@@ -979,6 +899,14 @@ class VirtualEmpty(SingleQubitOperation, ICircuitOperation):
         )
     # endregion
 
+    # region Class Methods
+    def _construct_channel_identifiers(self) -> Tuple[ChannelIdentifier, ...]:
+        """:return: Array-like of channel identifiers to which this operation applies to."""
+        return (
+            get_channel_identifier(self.qubit_index, self.qubit_channel),
+        )
+    # endregion
+
 
 if __name__ == '__main__':
     from qce_circuit.structure.registry_duration import (
@@ -5,7 +5,7 @@ from abc import ABC, abstractmethod, ABCMeta
 from dataclasses import dataclass, field
 from functools import lru_cache
 from enum import unique, Enum, auto
-from typing import TypeVar, Generic, List, Dict, Optional
+from typing import TypeVar, Generic, List, Dict, Optional, Sequence
 from warnings import warn
 from qce_circuit.utilities.custom_exceptions import (
     InterfaceMethodException,
@@ -145,7 +145,8 @@ class RelationLink(IRelationLink[TDurationComponent], Generic[TDurationComponent
     """
     Data class, implementing IRelationLink interface.
     """
-    _reference_node: Optional[TDurationComponent] = field(init=True, repr=True, compare=True)
+    _reference_node: Optional[TDurationComponent] = field(init=True, repr=True, compare=True, hash=False)
+    """Excluded from hash, the unique identifier already distinguishes links and avoids hashing the full relation chain."""
     _relation_type: RelationType = field(init=True, repr=True, compare=True, default=RelationType.FOLLOWED_BY)
     _identifier: int = field(init=False, repr=True, compare=True, default_factory=lambda: RelationLink._id_counter)
     """Automatically populated (instance) identifier."""
@@ -165,6 +166,7 @@ class RelationLink(IRelationLink[TDurationComponent], Generic[TDurationComponent
     # endregion
 
     # region Interface Methods
+    # Call with positional duration, lru_cache keys keyword arguments separately (and slower).
     @lru_cache(maxsize=None)
     def get_start_time(self, duration: float) -> float:
         """:return: Start time based on reference and self-duration."""
@@ -184,9 +186,10 @@ class RelationLink(IRelationLink[TDurationComponent], Generic[TDurationComponent
         :param relation_transfer_lookup: (Optional) Lookup table used to transfer relation link.
         :return: Copy of self with updated relation link.
         """
-        if relation_transfer_lookup is None:
-            relation_transfer_lookup = {}
-        transferred_reference_node: Optional[TDurationComponent] = relation_transfer_lookup.get(self._reference_node, None)
+        transferred_reference_node: Optional[TDurationComponent] = None
+        # Only consult lookup if there is a reference node to transfer
+        if self._reference_node is not None and relation_transfer_lookup is not None:
+            transferred_reference_node = relation_transfer_lookup.get(self._reference_node, None)
 
         return RelationLink(
             _reference_node=transferred_reference_node,
@@ -253,6 +256,16 @@ class ChannelIdentifier:
     # endregion
 
 
+@lru_cache(maxsize=None)
+def get_channel_identifier(qubit_index: int, channel: QubitChannel) -> ChannelIdentifier:
+    """
+    Flyweight constructor, channel identifiers are immutable and shared between operations.
+    Membership checks on shared instances resolve through identity before equality.
+    :return: (Interned) channel identifier for qubit index and channel type.
+    """
+    return ChannelIdentifier(_id=qubit_index, _channel=channel)
+
+
 class IRelationComponent(ABC, Generic[TDurationComponent]):
     """
     Interface class, describing relation to other ICircuitOperations.
@@ -286,7 +299,7 @@ class ICircuitOperation(ICircuitNode, IRelationComponent['ICircuitOperation'], I
     # region Interface Properties
     @property
     @abstractmethod
-    def channel_identifiers(self) -> List[ChannelIdentifier]:
+    def channel_identifiers(self) -> Sequence[ChannelIdentifier]:
         """:return: Array-like of channel identifiers to which this operation applies to."""
         raise InterfaceMethodException
     # endregion
@@ -311,7 +324,7 @@ class ICircuitOperation(ICircuitNode, IRelationComponent['ICircuitOperation'], I
         raise InterfaceMethodException
 
     @abstractmethod
-    def decomposed_operations(self) -> List['ICircuitOperation']:
+    def decomposed_operations(self) -> Sequence['ICircuitOperation']:
         """
         Functions similar to a 'flatten' operation.
         Mostly intended for composite-operations such that they can apply repetition and state-dependent registries.
@@ -381,7 +394,7 @@ class MultiRelationLink(IRelationLink[TCircuitOperation], Generic[TCircuitOperat
             _reference_node=self.reference_node,
             _relation_type=self.relation_type,
         )
-        return relation_link.get_start_time(duration=duration)
+        return relation_link.get_start_time(duration)
 
     def copy(self, relation_transfer_lookup: Optional[Dict[TDurationComponent, TDurationComponent]] = None) -> 'MultiRelationLink':
         """
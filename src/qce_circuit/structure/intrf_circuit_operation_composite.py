@@ -4,7 +4,7 @@
 from abc import abstractmethod, ABCMeta
 from dataclasses import dataclass, field
 import warnings
-from typing import List, Iterator, Optional, Dict
+from typing import List, Sequence, Iterator, Optional, Dict
 import numpy as np
 from tqdm import tqdm
 from qce_circuit.utilities.custom_exceptions import InterfaceMethodException
@@ -100,7 +100,7 @@ class CircuitGraphBranch(GraphBranch[OperationGraphNode]):
             if isinstance(node, OperationGraphNode):
                 yield node
 
-    def get_leaf_at_any(self, channel_identifiers: List[ChannelIdentifier]) -> Optional[OperationGraphNode]:
+    def get_leaf_at_any(self, channel_identifiers: Sequence[ChannelIdentifier]) -> Optional[OperationGraphNode]:
         """
         If not able to find channel identifier in any of the nodes, return None.
         :return: Latest relation node in channel. Defined in relation steps, not in time.
@@ -216,7 +216,7 @@ class CircuitCompositeOperation(ICircuitCompositeOperation):
     @property
     def start_time(self) -> float:
         """:return: Start time [a.u.]."""
-        return self.relation_link.get_start_time(duration=self.duration)
+        return self.relation_link.get_start_time(self.duration)
 
     @property
     def empty_composite(self) -> bool:
@@ -3,9 +3,10 @@
 # -------------------------------------------
 
 
-class InterfaceMethodException(Exception):
+class InterfaceMethodException(NotImplementedError):
     """
     Raised when the interface method is not implemented.
+    Derives from NotImplementedError, such that it is treated as the standard abstract-method signal.
     """
 
 
@@ -4,7 +4,7 @@
 from typing import List
 from qce_circuit.structure.intrf_circuit_operation import (
     ICircuitOperation,
-    ChannelIdentifier,
+    get_channel_identifier,
     QubitChannel,
 )
 from qce_circuit.structure.intrf_circuit_operation_composite import (
@@ -351,11 +351,11 @@ class VirtualTwoQubitVacantFactory(IOperationDrawComponentFactory[VirtualTwoQubi
     def construct(self, operation: VirtualTwoQubitVacant, transform_constructor: ITransformConstructor) -> IDrawComponent:
         """:return: Draw component based on operation type."""
         main_transform: IRectTransform = transform_constructor.construct_transform(
-            identifier=ChannelIdentifier(_id=operation.control_qubit_index, _channel=QubitChannel.FLUX),
+            identifier=get_channel_identifier(operation.control_qubit_index, QubitChannel.FLUX),
             time_component=operation,
         )
         second_transform: IRectTransform = transform_constructor.construct_transform(
-            identifier=ChannelIdentifier(_id=operation.target_qubit_index, _channel=QubitChannel.FLUX),
+            identifier=get_channel_identifier(operation.target_qubit_index, QubitChannel.FLUX),
             time_component=operation,
         )
         return BlockTwoQubitVacant(
@@ -430,11 +430,11 @@ class TwoQubitBlockFactory(IOperationDrawComponentFactory[CPhase, IDrawComponent
     def construct(self, operation: CPhase, transform_constructor: ITransformConstructor) -> IDrawComponent:
         """:return: Draw component based on operation type."""
         main_transform: IRectTransform = transform_constructor.construct_transform(
-            identifier=ChannelIdentifier(_id=operation.control_qubit_index, _channel=QubitChannel.FLUX),
+            identifier=get_channel_identifier(operation.control_qubit_index, QubitChannel.FLUX),
             time_component=operation,
         )
         second_transform: IRectTransform = transform_constructor.construct_transform(
-            identifier=ChannelIdentifier(_id=operation.target_qubit_index, _channel=QubitChannel.FLUX),
+            identifier=get_channel_identifier(operation.target_qubit_index, QubitChannel.FLUX),
             time_component=operation,
         )
         return BlockTwoQubitGate(
@@ -454,7 +454,7 @@ class BarrierFactory(IOperationDrawComponentFactory[Barrier, IDrawComponent]):
         """:return: Draw component based on operation type."""
         transforms: List[IRectTransform] = [
             transform_constructor.construct_transform(
-                identifier=ChannelIdentifier(_id=qubit_index, _channel=QubitChannel.ALL),
+                identifier=get_channel_identifier(qubit_index, QubitChannel.ALL),
                 time_component=operation,
             )
             for qubit_index in operation.qubit_indices
@@ -4,7 +4,7 @@
 # -------------------------------------------
 from typing import List, Generic, Dict, Tuple, TypeVar, Type
 from dataclasses import dataclass, field
-from qce_circuit.structure.intrf_circuit_operation import TCircuitOperation, ChannelIdentifier, QubitChannel
+from qce_circuit.structure.intrf_circuit_operation import TCircuitOperation, QubitChannel, get_channel_identifier
 from qce_circuit.structure.circuit_operations import CPhase, TwoQubitOperation
 from qce_circuit.visualization.visualize_circuit.draw_components.factory_draw_components import TwoQubitBlockFactory
 from qce_circuit.visualization.visualize_circuit.draw_components.transform_constructor import OffsetTransformConstructor
@@ -76,11 +76,11 @@ class SpaceSharedOperations(Generic[TCircuitOperation]):
         operation_to_transform: Dict[TCircuitTwoQubitOperation, IRectTransform] = {
             operation: transform_constructor.combine_transforms(transforms=[
                 transform_constructor.construct_transform(
-                    identifier=ChannelIdentifier(_id=operation.control_qubit_index, _channel=QubitChannel.ALL),
+                    identifier=get_channel_identifier(operation.control_qubit_index, QubitChannel.ALL),
                     time_component=operation,
                 ),
                 transform_constructor.construct_transform(
-                    identifier=ChannelIdentifier(_id=operation.target_qubit_index, _channel=QubitChannel.ALL),
+                    identifier=get_channel_identifier(operation.target_qubit_index, QubitChannel.ALL),
                     time_component=operation,
                 )
             ])
@@ -853,6 +853,27 @@ class DeclarativeCircuitTestCase(unittest.TestCase):
         channel_order = ['D3', 'D4', 'D5', 'D6', 'D7', 'Z1', 'Z2', 'Z3', 'Z4']
         fig, ax = plot_circuit(circuit=circuit, channel_order=channel_order)
         fig, ax = plot_circuit(circuit=modified_circuit, channel_order=channel_order)
+
+    def test_add_operations(self):
+        """Tests bulk addition of operations is equivalent to individual addition."""
+        operations = [
+            Reset(qubit_index=0),
+            Rx90(qubit_index=0),
+            Wait(qubit_index=1),
+            CPhase(control_qubit_index=0, target_qubit_index=1),
+        ]
+        individual_circuit: DeclarativeCircuit = DeclarativeCircuit()
+        for operation in operations:
+            individual_circuit.add(operation.copy())
+        bulk_circuit: DeclarativeCircuit = DeclarativeCircuit()
+        self.assertIs(bulk_circuit.add_operations(operation.copy() for operation in operations), bulk_circuit)
+
+        self.assertEqual(
+            [type(operation) for operation in bulk_circuit.operations],
+            [type(operation) for operation in individual_circuit.operations],
+        )
+        self.assertIsInstance(bulk_circuit.get_last_entry(), CPhase)
+        self.assertAlmostEqual(bulk_circuit.duration, individual_circuit.duration)
     # endregion
 
     # region Teardown
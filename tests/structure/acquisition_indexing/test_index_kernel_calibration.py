@@ -1,8 +1,11 @@
 import unittest
+import copy
 from numpy.testing import assert_array_equal
 from qce_circuit.structure.acquisition_indexing.kernel_calibration import (
     QutritCalibrationIndexKernel,
+    GeneralCalibrationIndexKernel,
 )
+from qce_circuit.structure.acquisition_indexing.intrf_stabilizer_index_kernel import StateKey
 from qce_circuit.structure.acquisition_indexing.intrf_index_strategy import (
     FixedIndexStrategy,
     RelativeIndexStrategy,
@@ -79,19 +82,46 @@ class QutritCalibrationKernelTestCase(unittest.TestCase):
             msg="Index kernel will start relative to other kernel."
         )
 
+    def test_hashable(self):
+        """Tests kernel can be used as dictionary key."""
+        index_kernel = QutritCalibrationIndexKernel(
+            heralded_initialization=False,
+            index_offset_strategy=FixedIndexStrategy(index=self.start_index),
+            involved_qubit_ids=[self.qubit_id]
+        )
+        lookup = {self.index_kernel: True}
+        self.assertEqual(hash(index_kernel), hash(self.index_kernel))
+        self.assertTrue(lookup[index_kernel])
+
+    def test_copy(self):
+        """Tests (deep) copying kernel reconstructs cached attributes."""
+        copied_kernel = copy.deepcopy(self.index_kernel)
+        self.assertEqual(copied_kernel, self.index_kernel)
+        assert_array_equal(
+            copied_kernel.contains(element=self.qubit_id),
+            self.index_kernel.contains(element=self.qubit_id),
+        )
+
     def test_index_inclusion(self):
         """Tests arbitrary index retrieval."""
-        assert_array_equal(
+        self.assertEqual(
             self.index_kernel.contains(element=self.qubit_id),
             [0, 1, 2],
         )
         non_included_qubit = QubitIDObj('DummyID')
-        assert_array_equal(
+        self.assertEqual(
             self.index_kernel.contains(element=non_included_qubit),
             [],
-            err_msg="If qubit ID is not included in indexing kernel, return empty array."
+            msg="If qubit ID is not included in indexing kernel, return empty list."
         )
 
+    def test_contains_list(self):
+        """Tests contains returns (concatenable) list of integer indices, as declared by the kernel interface."""
+        indices = self.index_kernel.contains(element=self.qubit_id)
+        self.assertIsInstance(indices, list)
+        self.assertTrue(all(type(index) is int for index in indices))
+        self.assertEqual(indices + indices, [0, 1, 2, 0, 1, 2])
+
     def test_specific_index_retrieval(self):
         """Tests specific index retrieval."""
         index_kernel = QutritCalibrationIndexKernel(
@@ -124,6 +154,124 @@ class QutritCalibrationKernelTestCase(unittest.TestCase):
             index_kernel.get_state_2_measurement_index(element=self.qubit_id),
             [5],
         )
+        assert_array_equal(
+            index_kernel.contains(element=self.qubit_id),
+            [0, 1, 2, 3, 4, 5],
+        )
+    # endregion
+
+    # region Teardown
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """Closes any left over processes after testing"""
+        pass
+    # endregion
+
+
+class GeneralCalibrationKernelTestCase(unittest.TestCase):
+
+    # region Setup
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Set up for all test cases"""
+        cls.start_index: int = 0
+        cls.qubit_id: IQubitID = QubitIDObj('Q')
+
+    def setUp(self) -> None:
+        """Set up for every test case"""
+        pass
+    # endregion
+
+    # region Test Cases
+    def test_cycle_length(self):
+        """Tests cycle length for all combinations of heralded initialization and f-state inclusion."""
+        for heralded_initialization, f_state, expected_length in [
+            (False, False, 2),
+            (False, True, 3),
+            (True, False, 4),
+            (True, True, 6),
+        ]:
+            with self.subTest(heralded_initialization=heralded_initialization, f_state=f_state):
+                index_kernel = GeneralCalibrationIndexKernel(
+                    index_offset_strategy=FixedIndexStrategy(index=self.start_index),
+                    heralded_initialization=heralded_initialization,
+                    f_state=f_state,
+                    repetitions=3,
+                )
+                self.assertEqual(
+                    index_kernel.cycle_length,
+                    expected_length,
+                )
+                self.assertEqual(
+                    index_kernel.stop_index,
+                    self.start_index + 3 * expected_length - 1,
+                )
+
+    def test_copy(self):
+        """Tests (deep) copying kernel reconstructs cached attributes."""
+        index_kernel = GeneralCalibrationIndexKernel(
+            index_offset_strategy=FixedIndexStrategy(index=self.start_index),
+            heralded_initialization=True,
+            f_state=True,
+        )
+        copied_kernel = copy.deepcopy(index_kernel)
+        self.assertEqual(copied_kernel.cycle_length, index_kernel.cycle_length)
+        self.assertEqual(copied_kernel.contained_states, index_kernel.contained_states)
+
+    def test_contained_states(self):
+        """Tests contained states with and without f-state."""
+        index_kernel = GeneralCalibrationIndexKernel(
+            index_offset_strategy=FixedIndexStrategy(index=self.start_index),
+            f_state=False,
+        )
+        self.assertEqual(
+            list(index_kernel.contained_states),
+            [StateKey.STATE_0, StateKey.STATE_1],
+        )
+        index_kernel = GeneralCalibrationIndexKernel(
+            index_offset_strategy=FixedIndexStrategy(index=self.start_index),
+            f_state=True,
+        )
+        self.assertEqual(
+            list(index_kernel.contained_states),
+            [StateKey.STATE_0, StateKey.STATE_1, StateKey.STATE_2],
+        )
+
+    def test_state_key_sorting(self):
+        """Tests state keys sort by integer value."""
+        self.assertEqual(
+            sorted([StateKey.STATE_2, StateKey.STATE_0, StateKey.STATE_1], key=int),
+            [StateKey.STATE_0, StateKey.STATE_1, StateKey.STATE_2],
+        )
+
+    def test_specific_index_retrieval(self):
+        """Tests specific index retrieval with heralded initialization and f-state."""
+        index_kernel = GeneralCalibrationIndexKernel(
+            index_offset_strategy=FixedIndexStrategy(index=self.start_index),
+            heralded_initialization=True,
+            f_state=True,
+            repetitions=2,
+        )
+        assert_array_equal(
+            index_kernel.get_heralded_state_measurement_index(state=StateKey.STATE_0),
+            [0, 6],
+        )
+        assert_array_equal(
+            index_kernel.get_calibration_state_measurement_index(state=StateKey.STATE_0),
+            [1, 7],
+        )
+        assert_array_equal(
+            index_kernel.get_heralded_state_measurement_index(state=StateKey.STATE_2),
+            [4, 10],
+        )
+        assert_array_equal(
+            index_kernel.get_calibration_state_measurement_index(state=StateKey.STATE_2),
+            [5, 11],
+        )
+        self.assertEqual(
+            index_kernel.contains(element=self.qubit_id),
+            list(range(12)),
+        )
     # endregion
 
     # region Teardown
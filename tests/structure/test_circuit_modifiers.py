@@ -0,0 +1,193 @@
+import unittest
+import pickle
+from dataclasses import dataclass
+from typing import Dict, Type
+from qce_circuit.language.declarative_circuit import DeclarativeCircuit
+from qce_circuit.structure.intrf_circuit_operation import (
+    QubitChannel,
+    RelationLink,
+    RelationType,
+)
+from qce_circuit.structure.circuit_operations import (
+    ICircuitOperation,
+    Reset,
+    Rx180,
+    Wait,
+    VirtualPark,
+    CPhase,
+    DispersiveMeasure,
+    VirtualVacant,
+    VirtualEmpty,
+    VirtualTwoQubitVacant,
+)
+from qce_circuit.structure.circuit_modifiers import (
+    replace_operation,
+    IOperationMask,
+    OperationVacantMask,
+    ChannelVacantMask,
+    ChannelTwoQubitVacantMask,
+)
+
+
+class CircuitModifierTestCase(unittest.TestCase):
+
+    # region Setup
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Set up for all test cases"""
+        pass
+
+    def setUp(self) -> None:
+        """Set up for every test case"""
+        circuit = DeclarativeCircuit()
+        reset_0 = circuit.add(Reset(qubit_index=0))
+        circuit.add(Reset(qubit_index=1, relation=RelationLink(reset_0, RelationType.JOINED_START)))
+        circuit.add(Rx180(qubit_index=0))
+        circuit.add(VirtualPark(qubit_index=1))
+        circuit.add(Wait(qubit_index=1, qubit_channel=QubitChannel.MICROWAVE))
+        circuit.add(CPhase(control_qubit_index=0, target_qubit_index=1))
+        circuit.add(DispersiveMeasure(qubit_index=0, acquisition_strategy=circuit.get_acquisition_strategy()))
+        self.circuit: DeclarativeCircuit = circuit
+    # endregion
+
+    # region Test Cases
+    def test_no_masks(self):
+        """Tests circuit reconstruction without masks keeps operation order and types."""
+        result: DeclarativeCircuit = replace_operation(self.circuit, operation_masks=[])
+        self.assertEqual(
+            [type(operation) for operation in result.operations],
+            [type(operation) for operation in self.circuit.operations],
+        )
+        self.assertAlmostEqual(result.duration, self.circuit.duration)
+
+    def test_operation_vacant_mask(self):
+        """Tests operation type specific masking."""
+        result: DeclarativeCircuit = replace_operation(
+            self.circuit,
+            operation_masks=[OperationVacantMask(operation_type=Rx180, qubit_index=0)],
+        )
+        masked_lookup = self.get_masked_lookup(result)
+        self.assertIsInstance(masked_lookup[Rx180], VirtualVacant)
+        self.assertEqual(masked_lookup[Rx180].qubit_index, 0)
+        self.assertIsInstance(masked_lookup[Reset], Reset)
+        self.assertAlmostEqual(result.duration, self.circuit.duration)
+
+    def test_channel_vacant_mask(self):
+        """Tests channel specific masking."""
+        result: DeclarativeCircuit = replace_operation(
+            self.circuit,
+            operation_masks=[
+                ChannelVacantMask(qubit_channel=QubitChannel.MICROWAVE, qubit_index=1),
+                ChannelVacantMask(qubit_channel=QubitChannel.FLUX, qubit_index=1),
+                ChannelVacantMask(qubit_channel=QubitChannel.READOUT, qubit_index=0),
+            ],
+        )
+        masked_lookup = self.get_masked_lookup(result)
+        self.assertIsInstance(masked_lookup[Reset], Reset, msg="Operations on all channels are not masked.")
+        self.assertIsInstance(masked_lookup[VirtualPark], VirtualEmpty)
+        self.assertIsInstance(masked_lookup[Wait], VirtualEmpty)
+        self.assertIsInstance(masked_lookup[DispersiveMeasure], VirtualVacant)
+        self.assertIsInstance(masked_lookup[Rx180], Rx180)
+
+    def test_two_qubit_vacant_mask(self):
+        """Tests two-qubit operation masking."""
+        result: DeclarativeCircuit = replace_operation(
+            self.circuit,
+            operation_masks=[ChannelTwoQubitVacantMask(control_qubit_index=0, target_qubit_index=1)],
+        )
+        masked_lookup = self.get_masked_lookup(result)
+        self.assertIsInstance(masked_lookup[CPhase], VirtualTwoQubitVacant)
+        self.assertEqual(masked_lookup[CPhase].control_qubit_index, 0)
+        self.assertEqual(masked_lookup[CPhase].target_qubit_index, 1)
+        self.assertAlmostEqual(result.duration, self.circuit.duration)
+
+        result = replace_operation(
+            self.circuit,
+            operation_masks=[ChannelTwoQubitVacantMask(control_qubit_index=1, target_qubit_index=2)],
+        )
+        self.assertIsInstance(self.get_masked_lookup(result)[CPhase], CPhase)
+
+    def test_custom_mask_default_candidate_types(self):
+        """Tests (user-defined) masks without candidate types are offered every operation."""
+
+        class ResetVacantMask(IOperationMask):
+            def match(self, matched_operation: ICircuitOperation) -> bool:
+                return isinstance(matched_operation, Reset)
+
+            def construct_operation_mask(self, masked_operation: ICircuitOperation) -> ICircuitOperation:
+                return VirtualVacant(
+                    qubit_index=masked_operation.qubit_index,
+                    duration_strategy=masked_operation.duration_strategy,
+                    relation=masked_operation.relation_link,
+                )
+
+        operation_mask = ResetVacantMask()
+        self.assertEqual(operation_mask.candidate_types, (ICircuitOperation,))
+        result: DeclarativeCircuit = replace_operation(self.circuit, operation_masks=[operation_mask])
+        self.assertIsInstance(self.get_masked_lookup(result)[Reset], VirtualVacant)
+        self.assertIsInstance(self.get_masked_lookup(result)[Rx180], Rx180)
+
+    def test_duplicate_and_unhashable_masks(self):
+        """Tests duplicate masks are ignored and unhashable (user-defined) masks are accepted."""
+
+        @dataclass
+        class UnhashableResetMask(IOperationMask):
+            qubit_index: int
+
+            def match(self, matched_operation: ICircuitOperation) -> bool:
+                return isinstance(matched_operation, Reset) and matched_operation.qubit_index == self.qubit_index
+
+            def construct_operation_mask(self, masked_operation: ICircuitOperation) -> ICircuitOperation:
+                return VirtualVacant(
+                    qubit_index=masked_operation.qubit_index,
+                    duration_strategy=masked_operation.duration_strategy,
+                    relation=masked_operation.relation_link,
+                )
+
+        result: DeclarativeCircuit = replace_operation(
+            self.circuit,
+            operation_masks=[
+                UnhashableResetMask(qubit_index=1),
+                OperationVacantMask(operation_type=Rx180, qubit_index=0),
+                OperationVacantMask(operation_type=Rx180, qubit_index=0),
+                UnhashableResetMask(qubit_index=1),
+            ],
+        )
+        masked_lookup = self.get_masked_lookup(result)
+        self.assertIsInstance(masked_lookup[Reset], VirtualVacant)
+        self.assertIsInstance(masked_lookup[Rx180], VirtualVacant)
+        self.assertAlmostEqual(result.duration, self.circuit.duration)
+
+    def test_mask_pickle(self):
+        """Tests (un)pickling masks reconstructs cached attributes."""
+        masks = [
+            ChannelVacantMask(qubit_channel=QubitChannel.FLUX, qubit_index=1),
+            ChannelTwoQubitVacantMask(control_qubit_index=0, target_qubit_index=1),
+        ]
+        for mask in masks:
+            with self.subTest(mask=mask):
+                copied_mask = pickle.loads(pickle.dumps(mask))
+                self.assertEqual(copied_mask, mask)
+                self.assertEqual(hash(copied_mask), hash(mask))
+                self.assertEqual(copied_mask.candidate_types, mask.candidate_types)
+        self.assertEqual(
+            pickle.loads(pickle.dumps(masks[1])).qubit_channel_identifiers,
+            masks[1].qubit_channel_identifiers,
+        )
+    # endregion
+
+    # region Class Methods
+    def get_masked_lookup(self, result: DeclarativeCircuit) -> Dict[Type[ICircuitOperation], ICircuitOperation]:
+        """:return: Lookup from original operation type to (last) corresponding operation in result."""
+        return {
+            type(original_operation): result_operation
+            for original_operation, result_operation in zip(self.circuit.operations, result.operations)
+        }
+    # endregion
+
+    # region Teardown
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """Closes any left over processes after testing"""
+        pass
+    # endregion
@@ -0,0 +1,133 @@
+import unittest
+from qce_circuit.structure.intrf_circuit_operation import (
+    QubitChannel,
+    ChannelIdentifier,
+    RelationLink,
+)
+from qce_circuit.structure.circuit_operations import (
+    SingleQubitOperation,
+    Reset,
+    Identity,
+    Hadamard,
+    Rx90,
+    Rxm90,
+    Ry180,
+    Ry90,
+    Rym90,
+    Rx180ef,
+    VirtualPhase,
+    Rphi90,
+    Wait,
+    Rx180,
+    VirtualPark,
+    CPhase,
+    DispersiveMeasure,
+    VirtualTwoQubitVacant,
+    Barrier,
+)
+from qce_circuit.structure.registry_acquisition import (
+    AcquisitionRegistry,
+    RegistryAcquisitionStrategy,
+)
+from qce_circuit.structure.intrf_circuit_operation_composite import CircuitCompositeOperation
+
+
+class CircuitOperationTestCase(unittest.TestCase):
+
+    # region Setup
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Set up for all test cases"""
+        pass
+
+    def setUp(self) -> None:
+        """Set up for every test case"""
+        pass
+    # endregion
+
+    # region Test Cases
+    def test_channel_identifiers(self):
+        """Tests channel identifiers per operation type."""
+        acquisition_strategy = RegistryAcquisitionStrategy(AcquisitionRegistry(CircuitCompositeOperation()))
+        for operation, expected_identifiers in [
+            (Reset(qubit_index=0), [ChannelIdentifier(_id=0, _channel=QubitChannel.ALL)]),
+            (Wait(qubit_index=1, qubit_channel=QubitChannel.FLUX), [ChannelIdentifier(_id=1, _channel=QubitChannel.FLUX)]),
+            (Rx180(qubit_index=2), [ChannelIdentifier(_id=2, _channel=QubitChannel.MICROWAVE)]),
+            (VirtualPark(qubit_index=3), [ChannelIdentifier(_id=3, _channel=QubitChannel.FLUX)]),
+            (DispersiveMeasure(qubit_index=4, acquisition_strategy=acquisition_strategy), [ChannelIdentifier(_id=4, _channel=QubitChannel.READOUT)]),
+            (VirtualTwoQubitVacant(control_qubit_index=0, target_qubit_index=1, qubit_channel=QubitChannel.FLUX), [
+                ChannelIdentifier(_id=0, _channel=QubitChannel.FLUX),
+                ChannelIdentifier(_id=1, _channel=QubitChannel.FLUX),
+            ]),
+            (Barrier(qubit_indices=[0, 2]), [
+                ChannelIdentifier(_id=0, _channel=QubitChannel.ALL),
+                ChannelIdentifier(_id=2, _channel=QubitChannel.ALL),
+            ]),
+        ]:
+            with self.subTest(operation=type(operation).__name__):
+                self.assertEqual(
+                    [(identifier.id, identifier.channel) for identifier in operation.channel_identifiers],
+                    [(identifier.id, identifier.channel) for identifier in expected_identifiers],
+                )
+
+    def test_fixed_channel_identifiers(self):
+        """Tests fixed-channel operation types occupy their class-level qubit channel."""
+        for operation_type, expected_channel in [
+            (Reset, QubitChannel.ALL),
+            (Identity, QubitChannel.MICROWAVE),
+            (Hadamard, QubitChannel.MICROWAVE),
+            (Rx180, QubitChannel.MICROWAVE),
+            (Rx90, QubitChannel.MICROWAVE),
+            (Rxm90, QubitChannel.MICROWAVE),
+            (Ry180, QubitChannel.MICROWAVE),
+            (Ry90, QubitChannel.MICROWAVE),
+            (Rym90, QubitChannel.MICROWAVE),
+            (Rx180ef, QubitChannel.MICROWAVE),
+            (VirtualPhase, QubitChannel.MICROWAVE),
+            (Rphi90, QubitChannel.MICROWAVE),
+            (VirtualPark, QubitChannel.FLUX),
+        ]:
+            with self.subTest(operation=operation_type.__name__):
+                operation: SingleQubitOperation = operation_type(qubit_index=5)
+                self.assertEqual(
+                    [(identifier.id, identifier.channel) for identifier in operation.channel_identifiers],
+                    [(5, expected_channel)],
+                )
+
+    def test_channel_identifiers_cached(self):
+        """Tests channel identifiers are constructed once and reconstructed on copy."""
+        operation = CPhase(control_qubit_index=0, target_qubit_index=1)
+        self.assertIs(operation.channel_identifiers, operation.channel_identifiers)
+        self.assertEqual(len(operation.channel_identifiers), 4)
+
+        copied_operation = operation.copy()
+        self.assertIsNot(copied_operation.channel_identifiers, operation.channel_identifiers)
+        self.assertEqual(copied_operation.channel_identifiers, operation.channel_identifiers)
+
+    def test_identity_semantics(self):
+        """Tests operations compare and hash on instance identity, each operation is a unique circuit node."""
+        operation = Rx180(qubit_index=0)
+        similar_operation = Rx180(qubit_index=0, relation=operation.relation)
+        self.assertEqual(operation, operation)
+        self.assertNotEqual(operation, similar_operation)
+        self.assertEqual(len({operation, similar_operation, operation}), 2)
+        self.assertEqual(hash(operation), id(operation))
+        barrier = Barrier(qubit_indices=[0, 1])
+        self.assertNotEqual(barrier, Barrier(qubit_indices=[0, 1]))
+        self.assertEqual(hash(barrier), id(barrier))
+
+    def test_relation_chain_hash(self):
+        """Tests hashing (and start time) of operations does not recurse over the relation chain."""
+        operation = Rx180(qubit_index=0)
+        for _ in range(2000):
+            operation = Rx180(qubit_index=0, relation=RelationLink(operation))
+        self.assertIsInstance(hash(operation), int)
+        self.assertEqual(hash(operation.relation), hash(operation.relation))
+    # endregion
+
+    # region Teardown
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """Closes any left over processes after testing"""
+        pass
+    # endregion